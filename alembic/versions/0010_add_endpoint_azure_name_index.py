@@ -0,0 +1,27 @@
+"""Index endpoints by Azure endpoint name
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add an index for lookups and syncs keyed on the Azure endpoint name."""
+    op.create_index(
+        "ix_endpoint_azure_name", "endpoints", ["azure_endpoint_name", "user_id"]
+    )
+
+
+def downgrade():
+    """Drop the Azure endpoint name index."""
+    op.drop_index("ix_endpoint_azure_name", table_name="endpoints")
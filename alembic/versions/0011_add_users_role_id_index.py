@@ -0,0 +1,25 @@
+"""Index users by role
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add an index for the role-in-use check made when deleting a role."""
+    op.create_index("ix_users_role_id", "users", ["role_id"])
+
+
+def downgrade():
+    """Drop the users role index."""
+    op.drop_index("ix_users_role_id", table_name="users")
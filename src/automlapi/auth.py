@@ -1,14 +1,17 @@
 """Authentication utilities used by the API."""
 
+import inspect
 from enum import Enum
 from functools import wraps
 from typing import Optional
 
 import jwt
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, WebSocket
 from fastapi.security import HTTPBearer
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
+from .cache import TTLCache
 from .config import settings
 from .db import get_db
 from .db.models import Role as RoleModel
@@ -16,6 +19,24 @@ from .db.models import User as UserModel
 
 security = HTTPBearer()
 
+# Built once so SQLAlchemy reuses the compiled SQL on every request and only the
+# bound user id changes. Users without a role yield no row.
+_ROLE_FOR_USER = (
+    select(RoleModel.name)
+    .select_from(UserModel)
+    .join(RoleModel, UserModel.role_id == RoleModel.id)
+    .where(UserModel.id == bindparam("user_id"))
+)
+
+# Role names by user id, so repeat callers skip the lookup. Role changes made
+# through the API drop the entry; others apply within the TTL.
+_role_cache = TTLCache(ttl=60)
+
+
+def invalidate_role_cache(user_id) -> None:
+    """Forget the cached role for ``user_id`` after its assignment changes."""
+    _role_cache.pop(str(user_id).lower())
+
 
 class UserRole(str, Enum):
     """User roles for RBAC."""
@@ -45,59 +66,89 @@ class UserInfo:
         return user_level >= required_level
 
 
+def _user_from_token(token: str, db: Session) -> UserInfo:
+    """Decode ``token`` and look up the user's role; raises if either fails."""
+    payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+    user_id = payload.get("sub")
+
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    role = _role_cache.get_or_set(
+        user_id.lower(),
+        lambda: db.scalar(_ROLE_FOR_USER, {"user_id": user_id}),
+    )
+
+    return UserInfo(user_id=user_id, role=role)
+
+
 async def get_current_user(
     token: str = Depends(security), db: Session = Depends(get_db)
 ) -> UserInfo:
     """Validate the JWT token and return user information with role."""
     try:
-        payload = jwt.decode(
-            token.credentials, settings.jwt_secret, algorithms=["HS256"]
-        )
-        user_id = payload.get("sub")
-
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid token")
+        return _user_from_token(token.credentials, db)
+    except Exception:
+        raise HTTPException(status_code=403, detail="Authentication failed")
 
-        # Look up user in database to get role
-        user_record = db.query(UserModel).filter(UserModel.id == user_id).first()
 
-        role = None
-        if user_record and user_record.role_id:
-            role_record = (
-                db.query(RoleModel).filter(RoleModel.id == user_record.role_id).first()
-            )
-            if role_record:
-                role = role_record.name
-
-        return UserInfo(user_id=user_id, role=role)
+def authenticate_websocket(websocket: WebSocket, db: Session) -> Optional[UserInfo]:
+    """Return the user behind a WebSocket handshake, or ``None``.
 
+    The token is read from the ``Authorization: Bearer`` header, or from the
+    ``token`` query parameter for browser clients, which cannot set headers.
+    Users without a role are not authenticated.
+    """
+    scheme, _, token = websocket.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        token = websocket.query_params.get("token", "")
+    if not token:
+        return None
+    try:
+        user = _user_from_token(token, db)
     except Exception:
-        raise HTTPException(status_code=403, detail="Authentication failed")
+        return None
+    return user if user.role else None
 
 
 def require_role(required_role: UserRole):
-    """Decorator to require a specific role or higher for route access."""
+    """Decorator to require a specific role or higher for route access.
+
+    Works for both ``async def`` routes and plain ``def`` routes, which FastAPI
+    runs in its threadpool.
+    """
+
+    def check_role(kwargs):
+        # Get current user from kwargs
+        current_user = None
+        for key, value in kwargs.items():
+            if isinstance(value, UserInfo):
+                current_user = value
+                break
+
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Authentication required")
+
+        if not current_user.has_role(required_role):
+            raise HTTPException(
+                status_code=403,
+                detail=f"Insufficient privileges. Required role: {required_role.value} or higher",
+            )
 
     def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Get current user from kwargs
-            current_user = None
-            for key, value in kwargs.items():
-                if isinstance(value, UserInfo):
-                    current_user = value
-                    break
-
-            if not current_user:
-                raise HTTPException(status_code=401, detail="Authentication required")
-
-            if not current_user.has_role(required_role):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Insufficient privileges. Required role: {required_role.value} or higher",
-                )
-
-            return await func(*args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                check_role(kwargs)
+                return await func(*args, **kwargs)
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                check_role(kwargs)
+                return func(*args, **kwargs)
 
         return wrapper
 
@@ -0,0 +1,61 @@
+"""In-process TTL cache for Azure ML reads that are polled frequently."""
+
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a fixed number of seconds."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # Evict the oldest insertion to keep memory bounded
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it with ``factory`` on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        """Drop ``key`` from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every key for which ``predicate`` returns True."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
@@ -15,6 +15,10 @@ class Settings(BaseSettings):
     azure_ml_workspace: str | None = None
     azure_ml_resource_group: str | None = None
 
+    # Wall-clock limits (seconds) for blocking Azure ML calls made by routes
+    azure_read_timeout: float = 30
+    azure_operation_timeout: float = 600
+
     # Azure SQL Database settings
     sql_server: str = "automldbserver.database.windows.net"
     sql_database: str = "automl"
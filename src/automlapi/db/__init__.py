@@ -2,7 +2,7 @@ import logging
 from typing import Generator
 
 from azure.identity import DefaultAzureCredential
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.pool import QueuePool
 
@@ -14,6 +14,10 @@ logger = logging.getLogger(__name__)
 # Database models base
 Base = declarative_base()
 
+# Connection pool limits for Azure SQL
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
+
 
 class DatabaseManager:
     """Manages Azure SQL Database connections with Azure Default Credential"""
@@ -40,6 +44,7 @@ class DatabaseManager:
                 self._engine = create_engine(
                     database_url,
                     echo=False,
+                    query_cache_size=1200,
                 )
                 logger.info("Using SQLite database for local testing")
             else:
@@ -53,13 +58,16 @@ class DatabaseManager:
                 self._engine = create_engine(
                     database_url,
                     poolclass=QueuePool,
-                    pool_size=5,
-                    max_overflow=10,
+                    pool_size=POOL_SIZE,
+                    max_overflow=MAX_OVERFLOW,
+                    pool_timeout=5,  # Fail fast instead of queueing for 30s
                     pool_pre_ping=True,
-                    pool_recycle=3600,  # 1 hour for Azure SQL
+                    pool_recycle=1800,  # Recycle before Azure SQL drops idle connections
+                    query_cache_size=1200,  # Reuse compiled SQL for hot lookups
                     echo=False,
                     connect_args=connect_args,
                 )
+                event.listen(self._engine, "checkout", self._warn_if_saturated)
 
             # Test connection
             try:
@@ -83,6 +91,18 @@ class DatabaseManager:
 
         return self._engine
 
+    def _warn_if_saturated(self, dbapi_connection, connection_record, proxy):
+        """Log when the last pooled connection is handed out.
+
+        Further requests wait up to ``pool_timeout`` for a connection, so this
+        is the signal to raise the pool limits or find slow requests.
+        """
+        pool = self._engine.pool
+        if pool.checkedin() == 0 and pool.overflow() >= MAX_OVERFLOW:
+            logger.warning(
+                f"Database pool saturated: {pool.checkedout()} connections in use"
+            )
+
     def get_session_local(self):
         """Get SQLAlchemy session factory"""
         if self._session_local is None:
@@ -94,6 +114,13 @@ class DatabaseManager:
             )
         return self._session_local
 
+    def dispose(self):
+        """Close pooled connections and drop the engine"""
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+            self._session_local = None
+
 
 # Global database manager instance
 db_manager = DatabaseManager()
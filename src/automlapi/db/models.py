@@ -160,7 +160,10 @@ class Model(TimestampMixin, Base):
 
 class Endpoint(TimestampMixin, Base):
     __tablename__ = "endpoints"
-    __table_args__ = (Index("ix_endpoint_user_id", "user_id", "id"),)
+    __table_args__ = (
+        Index("ix_endpoint_user_id", "user_id", "id"),
+        Index("ix_endpoint_azure_name", "azure_endpoint_name", "user_id"),
+    )
 
     id = Column(UUID, primary_key=True, default=default_uuid)
     user_id = Column(UUID, nullable=True)  # User who created the endpoint
@@ -227,7 +230,10 @@ class Role(TimestampMixin, Base):
 
 class User(TimestampMixin, Base):
     __tablename__ = "users"
-    __table_args__ = (Index("ix_user_id", "id"),)
+    __table_args__ = (
+        Index("ix_user_id", "id"),
+        Index("ix_users_role_id", "role_id"),
+    )
 
     id = Column(UUID, primary_key=True, default=default_uuid)
     role_id = Column(UUID, ForeignKey("roles.id", ondelete="SET NULL"))
@@ -242,5 +248,3 @@ class AuditEntry(TimestampMixin, Base):
     user_id = Column(UUID)
     action = Column(String(100))
     diff = Column(JSON)
-    __tablename__ = "audit_entries"
-    __table_args__ = (Index("ix_audit_tenant_timestamp", "tenant_id", "created_at"),)
@@ -1,20 +1,23 @@
 """FastAPI application setup and entry point."""
 
 from contextlib import asynccontextmanager
+from datetime import datetime
 
 import uvicorn
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import Depends, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi_mcp.server import FastApiMCP
 from fastapi_mcp.types import AuthConfig
 
 from .auth import get_current_user
 from .config import settings
+from .db import db_manager
 from .routes import (
     auth,
+    batch,
     datasets,
     deploy,
     endpoints,
@@ -30,17 +33,29 @@ scheduler = AsyncIOScheduler()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from .services.automl import warm_shared_service
     from .tasks.background import collect_endpoint_metrics
 
     scheduler.add_job(collect_endpoint_metrics, "interval", minutes=5)
+    # Runs once, off the event loop, so startup does not wait on Azure AD
+    scheduler.add_job(warm_shared_service)
+    if rbac.jwks_client is not None:
+        # First load runs right away, off the event loop, then hourly
+        scheduler.add_job(
+            rbac.refresh_signing_keys,
+            "interval",
+            hours=1,
+            next_run_time=datetime.now(),
+        )
     scheduler.start()
     try:
         yield
     finally:
         scheduler.shutdown()
+        db_manager.dispose()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 # Add exception handlers first
@@ -93,6 +108,7 @@ app.include_router(endpoints.router)
 app.include_router(users.router)
 app.include_router(rbac.router)
 app.include_router(deploy.router)
+app.include_router(batch.router)
 
 # Setup MCP after all routes are added
 mcp = FastApiMCP(
@@ -0,0 +1,103 @@
+"""API route for running several API calls in one HTTP request."""
+
+import asyncio
+from urllib.parse import unquote, urlsplit
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.routing import Match
+
+from ..auth import get_current_user
+from ..schemas.batch import (
+    BatchRequest,
+    BatchResponse,
+    BatchSubRequest,
+    BatchSubResponse,
+)
+
+router = APIRouter()
+
+# Sub-requests in flight per batch. Each holds a database connection and a
+# threadpool slot, so a full batch must not be able to drain the shared pool.
+MAX_CONCURRENT_SUB_REQUESTS = 4
+
+
+def _is_valid_sub_url(request: Request, url: str) -> bool:
+    """Whether ``url`` is a same-app path that does not resolve to this route.
+
+    The path is percent-decoded and checked segment by segment, since the HTTP
+    client collapses ``.`` and ``..`` before the app routes it. It is then
+    matched against the app's routes so no spelling can reach the batch
+    endpoint and nest batches.
+    """
+    if not url.startswith("/") or url.startswith("//"):
+        return False
+    path = unquote(urlsplit(url).path)
+    if any(segment in (".", "..") for segment in path.split("/")):
+        return False
+
+    # Also try the path without a trailing slash, which the router redirects
+    for candidate in {path, path.rstrip("/") or "/"}:
+        scope = {"type": "http", "path": candidate, "method": "POST"}
+        for route in request.app.router.routes:
+            match, _ = route.matches(scope)
+            if match != Match.NONE and getattr(route, "endpoint", None) is batch:
+                return False
+    return True
+
+
+async def _dispatch(
+    client: httpx.AsyncClient, sub: BatchSubRequest, limit: asyncio.Semaphore
+) -> BatchSubResponse:
+    """Run one sub-request against the app and capture its result."""
+    async with limit:
+        response = await client.request(
+            sub.method,
+            sub.url,
+            json=sub.body if sub.method in ("POST", "PUT") else None,
+        )
+    if response.headers.get("content-type", "").startswith("application/json"):
+        body = response.json()
+    else:
+        body = response.text or None
+    return BatchSubResponse(id=sub.id, status=response.status_code, body=body)
+
+
+@router.post(
+    "/batch",
+    response_model=BatchResponse,
+    operation_id="batch",
+)
+async def batch(
+    batch_request: BatchRequest,
+    request: Request,
+    user=Depends(get_current_user),
+) -> BatchResponse:
+    """Run several API calls in one request.
+
+    Each sub-request is dispatched in-process to this app with the caller's
+    credentials, so bulk clients pay for one HTTP round-trip instead of one per
+    record. Up to ``MAX_CONCURRENT_SUB_REQUESTS`` sub-requests run at a time,
+    so they must not depend on each other; responses are returned in request
+    order.
+    """
+    for sub in batch_request.requests:
+        if not _is_valid_sub_url(request, sub.url):
+            raise HTTPException(
+                status_code=400, detail=f"Invalid batch sub-request URL: {sub.url}"
+            )
+
+    headers = {}
+    if "authorization" in request.headers:
+        headers["authorization"] = request.headers["authorization"]
+
+    # A sub-request that raises becomes a 500 entry instead of failing the batch
+    transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://batch", headers=headers
+    ) as client:
+        limit = asyncio.Semaphore(MAX_CONCURRENT_SUB_REQUESTS)
+        responses = await asyncio.gather(
+            *(_dispatch(client, sub, limit) for sub in batch_request.requests)
+        )
+    return BatchResponse(responses=responses)
@@ -13,6 +13,7 @@ from fastapi import (
     Response,
     UploadFile,
 )
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from ..auth import UserInfo, get_current_user, require_maintainer
@@ -20,15 +21,20 @@ from ..db import get_db
 from ..db.models import Dataset as DatasetModel
 from ..db.models import Model as ModelModel
 from ..schemas.dataset import Dataset
-from ..services.automl import AzureAutoMLService
-from ..utils import model_to_schema, models_to_schema
+from ..services.automl import AzureAutoMLService, get_shared_service
+from ..utils import (
+    delete_record,
+    model_to_schema,
+    models_to_schema,
+    update_record,
+)
 
 router = APIRouter()
 
 
 def get_service() -> AzureAutoMLService:
-    """Provide a fresh service instance for each request."""
-    return AzureAutoMLService()
+    """Provide the shared service instance for each request."""
+    return get_shared_service()
 
 
 @router.post(
@@ -36,7 +42,7 @@ def get_service() -> AzureAutoMLService:
     response_model=Dataset,
     operation_id="create_dataset",
 )
-async def create_dataset(
+def create_dataset(
     file: UploadFile = File(..., description="Dataset file to upload"),
     name: str = Form(..., description="Name for the dataset"),
     description: str = Form(None, description="Optional description for the dataset"),
@@ -62,27 +68,30 @@ async def create_dataset(
         except json.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid JSON format for tags")
 
-    # Upload dataset to Azure ML
-    data = await file.read()
+    # Upload dataset to Azure ML, streaming from the upload's spooled file
+    # instead of reading it into memory
     try:
-        dataset_info = service.upload_dataset(name, data)
+        dataset_info = service.upload_dataset(name, file.file)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
-    # Create database record
-    record = DatasetModel(
-        id=dataset_info["id"],
-        uploaded_by=user.user_id,
-        asset_id=dataset_info.get("asset_id"),
-        name=dataset_info["name"],
-        version=dataset_info.get("version"),
-        storage_uri=dataset_info.get("storage_uri"),
-        tags=parsed_tags,
-        private=private,
-    )
-    db.add(record)
+    # Create the database record; RETURNING brings back the server defaults
+    # without a refresh SELECT
+    record = db.scalars(
+        insert(DatasetModel)
+        .values(
+            id=dataset_info["id"],
+            uploaded_by=user.user_id,
+            asset_id=dataset_info.get("asset_id"),
+            name=dataset_info["name"],
+            version=dataset_info.get("version"),
+            storage_uri=dataset_info.get("storage_uri"),
+            tags=parsed_tags,
+            private=private,
+        )
+        .returning(DatasetModel)
+    ).one()
     db.commit()
-    db.refresh(record)
 
     # Convert the database record to the response schema
     return model_to_schema(record, Dataset)
@@ -94,7 +103,7 @@ async def create_dataset(
     operation_id="list_datasets",
     tags=["mcp"],
 )
-async def list_datasets(
+def list_datasets(
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
     uploaded_by: str = Query(None, description="Filter datasets by uploader user ID"),
@@ -125,7 +134,7 @@ async def list_datasets(
     operation_id="get_dataset",
     tags=["mcp"],
 )
-async def get_dataset(
+def get_dataset(
     dataset_id: str = Path(..., description="Dataset identifier"),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -152,7 +161,7 @@ async def get_dataset(
     operation_id="delete_dataset",
 )
 @require_maintainer
-async def delete_dataset(
+def delete_dataset(
     dataset_id: str = Path(..., description="Dataset identifier"),
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -162,10 +171,8 @@ async def delete_dataset(
     Deletes the dataset record and associated storage if found.
     Only MAINTAINERs and ADMINs can delete datasets.
     """
-    record = db.get(DatasetModel, dataset_id)
-    if not record:
+    if not delete_record(db, DatasetModel, dataset_id):
         raise HTTPException(status_code=404, detail="Dataset not found")
-    db.delete(record)
     db.commit()
     return Response(status_code=204)
 
@@ -175,7 +182,7 @@ async def delete_dataset(
     response_model=Dataset,
     operation_id="update_dataset",
 )
-async def update_dataset(
+def update_dataset(
     dataset: Dataset,
     dataset_id: str = Path(..., description="Dataset identifier"),
     user=Depends(get_current_user),
@@ -185,13 +192,12 @@ async def update_dataset(
 
     Updates the stored metadata with the fields provided in the request body.
     """
-    record = db.get(DatasetModel, dataset_id)
+    record = update_record(
+        db, DatasetModel, dataset_id, dataset.model_dump(exclude_unset=True)
+    )
     if not record:
         raise HTTPException(status_code=404, detail="Dataset not found")
-    for field, value in dataset.model_dump().items():
-        setattr(record, field, value)
     db.commit()
-    db.refresh(record)
     return model_to_schema(record, Dataset)
 
 
@@ -201,7 +207,7 @@ async def update_dataset(
     operation_id="search_datasets",
     tags=["mcp"],
 )
-async def search_datasets(
+def search_datasets(
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
     tag_key: str = Query(None, description="Search by tag key"),
@@ -240,7 +246,7 @@ async def search_datasets(
     response_model=list,
     operation_id="get_dataset_experiments",
 )
-async def get_dataset_experiments(
+def get_dataset_experiments(
     dataset_id: str = Path(..., description="Dataset identifier"),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -277,7 +283,7 @@ async def get_dataset_experiments(
     response_model=list,
     operation_id="get_dataset_models",
 )
-async def get_dataset_models(
+def get_dataset_models(
     dataset_id: str = Path(..., description="Dataset identifier"),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
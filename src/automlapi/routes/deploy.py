@@ -5,24 +5,85 @@ from typing import Any, Dict, List
 from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from ..auth import UserInfo, get_current_user
+from ..cache import TTLCache
 from ..db import get_db
 from ..db.models import Deployment as DeploymentModel
 from ..db.models import Endpoint as EndpointModel
 from ..db.models import Experiment as ExperimentModel
 from ..db.models import Model as ModelModel
 from ..db.models import Run as RunModel
+from ..db.models import default_uuid
 from ..schemas.deployment import DeploymentRequest, DeploymentResponse
-from ..services.automl import AzureAutoMLService
+from ..services.automl import AzureAutoMLService, get_shared_service
+from .models import invalidate_model_cache
 
 router = APIRouter()
 
+# Existence lookups built once so SQLAlchemy reuses the compiled SQL and only
+# the bound parameters change between requests. They lock the looked-up key
+# until commit so concurrent deploys for the same user cannot both see the row
+# as missing and insert duplicates. SQL Server ignores FOR UPDATE, so the
+# equivalent UPDLOCK/HOLDLOCK table hint is added for it.
+_UPSERT_LOCK_HINT = "WITH (UPDLOCK, HOLDLOCK)"
+
+_MODEL_BY_NAME = (
+    select(ModelModel)
+    .where(
+        ModelModel.azure_model_name == bindparam("model_name"),
+        ModelModel.user_id == bindparam("user_id"),
+    )
+    .with_hint(ModelModel, _UPSERT_LOCK_HINT, "mssql")
+    .with_for_update()
+)
+_ENDPOINT_BY_NAME = (
+    select(EndpointModel)
+    .where(
+        EndpointModel.azure_endpoint_name == bindparam("endpoint_name"),
+        EndpointModel.user_id == bindparam("user_id"),
+    )
+    .with_hint(EndpointModel, _UPSERT_LOCK_HINT, "mssql")
+    .with_for_update()
+)
+
+# Dashboards poll status/metrics far more often than Azure state changes, so
+# short-lived caches keyed by (endpoint_name, deployment_name) absorb the load.
+_status_cache = TTLCache(ttl=15)
+_metrics_cache = TTLCache(ttl=60)
+
+
+def invalidate_deployment_cache(endpoint_name: str) -> None:
+    """Drop cached status and metrics for every deployment on an endpoint."""
+    for cache in (_status_cache, _metrics_cache):
+        cache.pop_matching(lambda key: key[0] == endpoint_name)
+
 
 def get_service() -> AzureAutoMLService:
-    """Provide a fresh service instance for each request."""
-    return AzureAutoMLService()
+    """Provide the shared service instance for each request."""
+    return get_shared_service()
+
+
+def validate_traffic_allocation(traffic_allocation: Dict[str, int]) -> None:
+    """Ensure each percentage is within 0-100 and that they sum to exactly 100."""
+    total_traffic = 0
+    out_of_range = False
+    for percentage in traffic_allocation.values():
+        total_traffic += percentage
+        out_of_range |= percentage < 0 or percentage > 100
+
+    if out_of_range:
+        raise HTTPException(
+            status_code=400,
+            detail="Traffic percentages must be between 0 and 100",
+        )
+    if total_traffic != 100:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Traffic allocation must sum to 100, got {total_traffic}",
+        )
 
 
 def create_or_update_model_record(
@@ -41,44 +102,50 @@ def create_or_update_model_record(
         model_reference.split(":") if ":" in model_reference else (model_reference, "1")
     )
 
+    algorithm = deployment_result.get("algorithm")
+    model_score = deployment_result.get("model_score")
+    deployment_timestamp = deployment_result.get("deployment_timestamp")
+    endpoint_name = deployment_result.get("endpoint_name")
+    model_uri = f"azureml://models/{model_name}/{model_version}"
+
     # Check if model already exists
     model_record = (
-        db.query(ModelModel)
-        .filter(
-            ModelModel.azure_model_name == model_name,
-            ModelModel.user_id == user.user_id,
+        db.execute(
+            _MODEL_BY_NAME, {"model_name": model_name, "user_id": user.user_id}
         )
+        .scalars()
         .first()
     )
 
     if not model_record:
         # Create new model record
         model_record = ModelModel(
+            id=default_uuid(),
             user_id=user.user_id,
             dataset_id=dataset_id,
             experiment_id=experiment_id,
             run_id=run_id,
             task_type=task_type,
-            algorithm=deployment_result.get("algorithm"),
+            algorithm=algorithm,
             azure_model_name=model_name,
             azure_model_version=model_version,
-            model_uri=f"azureml://models/{model_name}/{model_version}",
-            best_score=deployment_result.get("model_score"),
+            model_uri=model_uri,
+            best_score=model_score,
             registration_status="registered",
             model_metadata={
-                "deployment_timestamp": deployment_result.get("deployment_timestamp"),
+                "deployment_timestamp": deployment_timestamp,
                 "source_experiment": deployment_result.get("experiment_name"),
-                "azure_endpoint_name": deployment_result.get("endpoint_name"),
+                "azure_endpoint_name": endpoint_name,
             },
         )
         db.add(model_record)
     else:
         # Update existing model record
         model_record.azure_model_version = model_version
-        model_record.best_score = deployment_result.get("model_score")
+        model_record.best_score = model_score
         model_record.registration_status = "registered"
-        model_record.algorithm = deployment_result.get("algorithm")
-        model_record.model_uri = f"azureml://models/{model_name}/{model_version}"
+        model_record.algorithm = algorithm
+        model_record.model_uri = model_uri
         if run_id:
             model_record.run_id = run_id
 
@@ -87,10 +154,8 @@ def create_or_update_model_record(
             model_record.model_metadata = {}
         model_record.model_metadata.update(
             {
-                "last_deployment_timestamp": deployment_result.get(
-                    "deployment_timestamp"
-                ),
-                "azure_endpoint_name": deployment_result.get("endpoint_name"),
+                "last_deployment_timestamp": deployment_timestamp,
+                "azure_endpoint_name": endpoint_name,
             }
         )
 
@@ -103,7 +168,7 @@ def create_or_update_model_record(
     operation_id="deploy_experiment",
     tags=["mcp"],
 )
-async def deploy_best_model_from_experiment(
+def deploy_best_model_from_experiment(
     experiment_id: UUID = Path(description="Experiment ID to deploy from"),
     request: DeploymentRequest = None,
     user: UserInfo = Depends(get_current_user),
@@ -155,21 +220,23 @@ async def deploy_best_model_from_experiment(
                 dataset_id=experiment.dataset_id,
                 task_type=experiment.task_type,
             )
-            db.flush()  # Flush to get the model_record.id
 
             # Create or update endpoint record
             endpoint_record = (
-                db.query(EndpointModel)
-                .filter(
-                    EndpointModel.azure_endpoint_name
-                    == deployment_result.get("endpoint_name"),
-                    EndpointModel.user_id == user.user_id,
+                db.execute(
+                    _ENDPOINT_BY_NAME,
+                    {
+                        "endpoint_name": deployment_result.get("endpoint_name"),
+                        "user_id": user.user_id,
+                    },
                 )
+                .scalars()
                 .first()
             )
 
             if not endpoint_record:
                 endpoint_record = EndpointModel(
+                    id=default_uuid(),
                     user_id=user.user_id,
                     name=request.endpoint_name,
                     azure_endpoint_name=deployment_result.get("endpoint_name"),
@@ -192,8 +259,6 @@ async def deploy_best_model_from_experiment(
                 endpoint_record.deployment_status = "deployed"
                 endpoint_record.model_id = model_record.id
 
-            db.flush()  # Flush to get the endpoint_record.id
-
             # Create deployment record
             deployment_record = DeploymentModel(
                 user_id=user.user_id,
@@ -216,6 +281,7 @@ async def deploy_best_model_from_experiment(
             )
             db.add(deployment_record)
             db.commit()
+            invalidate_model_cache(model_record.id)
 
             return DeploymentResponse(
                 deployment_id=UUID(deployment_record.id),
@@ -265,7 +331,7 @@ async def deploy_best_model_from_experiment(
     operation_id="deploy_run",
     tags=["mcp"],
 )
-async def deploy_model_from_run(
+def deploy_model_from_run(
     run_id: UUID = Path(description="Run ID to deploy from"),
     request: DeploymentRequest = None,
     user: UserInfo = Depends(get_current_user),
@@ -313,21 +379,23 @@ async def deploy_model_from_run(
                 run_id=run_id,
                 task_type=run.metrics.get("task_type") if run.metrics else None,
             )
-            db.flush()  # Flush to get the model_record.id
 
             # Create or update endpoint record
             endpoint_record = (
-                db.query(EndpointModel)
-                .filter(
-                    EndpointModel.azure_endpoint_name
-                    == deployment_result.get("endpoint_name"),
-                    EndpointModel.user_id == user.user_id,
+                db.execute(
+                    _ENDPOINT_BY_NAME,
+                    {
+                        "endpoint_name": deployment_result.get("endpoint_name"),
+                        "user_id": user.user_id,
+                    },
                 )
+                .scalars()
                 .first()
             )
 
             if not endpoint_record:
                 endpoint_record = EndpointModel(
+                    id=default_uuid(),
                     user_id=user.user_id,
                     name=request.endpoint_name,
                     azure_endpoint_name=deployment_result.get("endpoint_name"),
@@ -352,8 +420,6 @@ async def deploy_model_from_run(
                 endpoint_record.model_id = model_record.id
                 endpoint_record.run_id = run_id
 
-            db.flush()  # Flush to get the endpoint_record.id
-
             # Create deployment record
             deployment_record = DeploymentModel(
                 user_id=user.user_id,
@@ -377,6 +443,7 @@ async def deploy_model_from_run(
             )
             db.add(deployment_record)
             db.commit()
+            invalidate_model_cache(model_record.id)
 
             return DeploymentResponse(
                 deployment_id=UUID(deployment_record.id),
@@ -425,7 +492,7 @@ async def deploy_model_from_run(
     operation_id="get_deployment_status",
     tags=["mcp"],
 )
-async def get_deployment_status(
+def get_deployment_status(
     endpoint_name: str = Path(description="Endpoint name"),
     deployment_name: str = Path(description="Deployment name"),
     user: UserInfo = Depends(get_current_user),
@@ -433,7 +500,10 @@ async def get_deployment_status(
 ) -> Dict[str, Any]:
     """Get the status and details of a specific deployment."""
     try:
-        status = service.get_deployment_status(endpoint_name, deployment_name)
+        status = _status_cache.get_or_set(
+            (endpoint_name, deployment_name),
+            lambda: service.get_deployment_status(endpoint_name, deployment_name),
+        )
         return status
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -445,7 +515,7 @@ async def get_deployment_status(
     operation_id="get_deployment_metrics",
     tags=["mcp"],
 )
-async def get_deployment_metrics(
+def get_deployment_metrics(
     endpoint_name: str = Path(description="Endpoint name"),
     deployment_name: str = Path(description="Deployment name"),
     user: UserInfo = Depends(get_current_user),
@@ -453,7 +523,10 @@ async def get_deployment_metrics(
 ) -> Dict[str, Any]:
     """Get performance metrics for a deployment."""
     try:
-        metrics = service.get_deployment_metrics(endpoint_name, deployment_name)
+        metrics = _metrics_cache.get_or_set(
+            (endpoint_name, deployment_name),
+            lambda: service.get_deployment_metrics(endpoint_name, deployment_name),
+        )
         return metrics
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -465,7 +538,7 @@ async def get_deployment_metrics(
     operation_id="update_deployment_traffic",
     tags=["mcp"],
 )
-async def update_deployment_traffic(
+def update_deployment_traffic(
     endpoint_name: str = Path(description="Endpoint name"),
     *,
     traffic_allocation: Dict[str, int] = Body(
@@ -479,18 +552,14 @@ async def update_deployment_traffic(
     The traffic_allocation should be a dict mapping deployment names to
     traffic percentages (must sum to 100).
     """
-    try:
-        # Validate traffic allocation
-        total_traffic = sum(traffic_allocation.values())
-        if total_traffic != 100:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Traffic allocation must sum to 100, got {total_traffic}",
-            )
+    # Validate before the Azure round-trip so malformed input fails fast as a 400
+    validate_traffic_allocation(traffic_allocation)
 
+    try:
         updated_traffic = service.update_endpoint_traffic(
             endpoint_name, traffic_allocation
         )
+        invalidate_deployment_cache(endpoint_name)
         return {
             "endpoint_name": endpoint_name,
             "traffic_allocation": updated_traffic,
@@ -506,7 +575,7 @@ async def update_deployment_traffic(
     operation_id="delete_deployment",
     tags=["mcp"],
 )
-async def delete_deployment(
+def delete_deployment(
     endpoint_name: str = Path(description="Endpoint name"),
     deployment_name: str = Path(description="Deployment name"),
     user: UserInfo = Depends(get_current_user),
@@ -532,7 +601,7 @@ async def delete_deployment(
     operation_id="list_experiment_deployments",
     tags=["mcp"],
 )
-async def list_experiment_deployments(
+def list_experiment_deployments(
     experiment_id: UUID = Path(description="Experiment ID"),
     user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -555,33 +624,21 @@ async def list_experiment_deployments(
                 detail=f"Experiment {experiment_id} not found or access denied",
             )
 
-        # Query deployments from database
-        deployments = (
-            db.query(DeploymentModel)
+        # One joined query replaces the per-row model and endpoint lookups. It
+        # runs here, in the request session, so database errors surface as a
+        # 500 rather than a truncated body.
+        rows = db.execute(
+            select(DeploymentModel, ModelModel, EndpointModel)
             .join(EndpointModel, DeploymentModel.endpoint_id == EndpointModel.id)
-            .filter(
+            .outerjoin(ModelModel, DeploymentModel.model_id == ModelModel.id)
+            .where(
                 EndpointModel.experiment_id == experiment_id,
                 EndpointModel.user_id == user.user_id,
             )
-            .all()
-        )
+        ).all()
 
-        deployment_list = []
-        for deployment in deployments:
-            # Get model info
-            model = (
-                db.query(ModelModel)
-                .filter(ModelModel.id == deployment.model_id)
-                .first()
-            )
-            # Get endpoint info
-            endpoint = (
-                db.query(EndpointModel)
-                .filter(EndpointModel.id == deployment.endpoint_id)
-                .first()
-            )
-
-            deployment_info = {
+        return [
+            {
                 "deployment_id": str(deployment.id),
                 "deployment_name": deployment.deployment_name,
                 "azure_deployment_name": deployment.azure_deployment_name,
@@ -598,12 +655,11 @@ async def list_experiment_deployments(
                 "model_name": model.azure_model_name if model else None,
                 "model_version": model.azure_model_version if model else None,
                 "model_algorithm": model.algorithm if model else None,
-                "endpoint_name": endpoint.name if endpoint else None,
-                "endpoint_url": endpoint.azure_endpoint_url if endpoint else None,
+                "endpoint_name": endpoint.name,
+                "endpoint_url": endpoint.azure_endpoint_url,
             }
-            deployment_list.append(deployment_info)
-
-        return deployment_list
+            for deployment, model, endpoint in rows
+        ]
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -615,7 +671,7 @@ async def list_experiment_deployments(
     operation_id="sync_azure_models",
     tags=["mcp"],
 )
-async def sync_azure_models_to_database(
+def sync_azure_models_to_database(
     user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
     service: AzureAutoMLService = Depends(get_service),
@@ -632,17 +688,18 @@ async def sync_azure_models_to_database(
 
         created_count = 0
         updated_count = 0
+        updated_ids = []
         errors = []
 
         for azure_model in azure_models:
             try:
                 # Check if model already exists in database
                 existing_model = (
-                    db.query(ModelModel)
-                    .filter(
-                        ModelModel.azure_model_name == azure_model.name,
-                        ModelModel.user_id == user.user_id,
+                    db.execute(
+                        _MODEL_BY_NAME,
+                        {"model_name": azure_model.name, "user_id": user.user_id},
                     )
+                    .scalars()
                     .first()
                 )
 
@@ -657,6 +714,7 @@ async def sync_azure_models_to_database(
                         existing_model.model_metadata["azure_description"] = (
                             azure_model.description
                         )
+                    updated_ids.append(existing_model.id)
                     updated_count += 1
                 else:
                     # Create new model record
@@ -683,6 +741,8 @@ async def sync_azure_models_to_database(
 
         # Commit all changes
         db.commit()
+        for model_id in updated_ids:
+            invalidate_model_cache(model_id)
 
         return {
             "status": "completed",
@@ -706,7 +766,7 @@ async def sync_azure_models_to_database(
     operation_id="get_model_registration_status",
     tags=["mcp"],
 )
-async def get_model_registration_status(
+def get_model_registration_status(
     user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> List[Dict[str, Any]]:
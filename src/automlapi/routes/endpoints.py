@@ -1,24 +1,105 @@
 """API routes for managing deployment endpoints."""
 
-import json
+import asyncio
+import logging
+import re
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Path, Response, WebSocket
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Form,
+    HTTPException,
+    Path,
+    Response,
+    WebSocket,
+)
+from sqlalchemy import func, insert, literal_column, update
 from sqlalchemy.orm import Session
 
-from ..auth import UserInfo, get_current_user, require_maintainer
+from ..auth import (
+    UserInfo,
+    authenticate_websocket,
+    get_current_user,
+    require_maintainer,
+)
+from ..cache import TTLCache
+from ..config import settings
 from ..db import get_db
 from ..db.models import Endpoint as EndpointModel
+from ..db.models import default_uuid
 from ..schemas.endpoint import Endpoint
-from ..services.automl import AzureAutoMLService
+from ..services.automl import AzureAutoMLService, get_shared_service
+from ..services.azure_client import call_with_timeout
+from ..tasks.broadcast import traffic_broadcaster
 from ..utils import model_to_schema, models_to_schema
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Dashboards poll the list/get/deployments routes far more often than endpoints
+# change in Azure ML, so the Azure reads are cached briefly and invalidated on
+# writes made through this API.
+_azure_cache = TTLCache(ttl=30)
+_MISSING = object()
+
+# Endpoint columns refreshed from Azure ML when a single endpoint is fetched
+_AZURE_SYNCED_FIELDS = (
+    "azure_endpoint_url",
+    "provisioning_state",
+    "deployments",
+    "traffic",
+    "tags",
+)
+
+
+def cached_azure_read(key, factory, response: Response):
+    """Return a cached Azure ML read, calling ``factory`` on a miss.
+
+    Sets ``X-Cache: HIT`` or ``X-Cache: MISS`` on the response.
+    """
+    value = _azure_cache.get(key, _MISSING)
+    if value is not _MISSING:
+        response.headers["X-Cache"] = "HIT"
+        return value
+    value = factory()
+    _azure_cache.set(key, value)
+    response.headers["X-Cache"] = "MISS"
+    return value
+
+
+def invalidate_endpoint_cache(azure_endpoint_name: Optional[str] = None) -> None:
+    """Drop the cached endpoint list and any reads for ``azure_endpoint_name``."""
+    _azure_cache.pop(("list_endpoints",))
+    if azure_endpoint_name:
+        _azure_cache.pop(("endpoint", azure_endpoint_name))
+        _azure_cache.pop(("deployments", azure_endpoint_name))
+
 
 def get_service() -> AzureAutoMLService:
-    """Provide a fresh service instance for each request."""
-    return AzureAutoMLService()
+    """Provide the shared service instance for each request."""
+    return get_shared_service()
+
+
+def get_endpoint_record(
+    endpoint_id: str = Path(..., description="Endpoint identifier"),
+    user: UserInfo = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> EndpointModel:
+    """Load the endpoint named in the path, or respond with 404.
+
+    Depends on ``get_current_user`` so unauthenticated callers are rejected
+    before the lookup and cannot probe which endpoints exist. Routes with a
+    role requirement load the record in the handler instead, after the role
+    check has run.
+    """
+    record = db.get(EndpointModel, endpoint_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Endpoint not found")
+    return record
 
 
 @router.post(
@@ -27,7 +108,7 @@ def get_service() -> AzureAutoMLService:
     operation_id="create_endpoint",
     tags=["mcp"],
 )
-async def create_endpoint(
+def create_endpoint(
     endpoint_name: str,
     description: Optional[str] = None,
     tags: Optional[str] = None,
@@ -43,14 +124,18 @@ async def create_endpoint(
     parsed_tags = None
     if tags:
         try:
-            parsed_tags = json.loads(tags)
-        except json.JSONDecodeError:
+            parsed_tags = orjson.loads(tags)
+        except orjson.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid JSON format for tags")
 
     try:
         # Create the endpoint in Azure ML
-        azure_endpoint = service.create_endpoint(
-            endpoint_name=endpoint_name, description=description, tags=parsed_tags
+        azure_endpoint = call_with_timeout(
+            settings.azure_operation_timeout,
+            service.create_endpoint,
+            endpoint_name=endpoint_name,
+            description=description,
+            tags=parsed_tags,
         )
 
         # Store the endpoint metadata in our database
@@ -69,7 +154,7 @@ async def create_endpoint(
         )
         db.add(record)
         db.commit()
-        db.refresh(record)
+        invalidate_endpoint_cache(record.azure_endpoint_name)
 
         return model_to_schema(record, Endpoint)
     except Exception as e:
@@ -84,7 +169,8 @@ async def create_endpoint(
     operation_id="list_endpoints",
     tags=["mcp"],
 )
-async def list_endpoints(
+def list_endpoints(
+    response: Response,
     user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
     service: AzureAutoMLService = Depends(get_service),
@@ -93,52 +179,57 @@ async def list_endpoints(
 
     Returns all endpoint records from both Azure ML and the local database.
     """
+    # Get endpoints from local database once; it also serves as the fallback
+    db_records = db.query(EndpointModel).all()
+
     try:
         # Get endpoints from Azure ML
-        azure_endpoints = service.list_endpoints()
+        azure_endpoints = cached_azure_read(
+            ("list_endpoints",),
+            lambda: call_with_timeout(
+                settings.azure_read_timeout, service.list_endpoints
+            ),
+            response,
+        )
 
-        # Get endpoints from local database
-        db_records = db.query(EndpointModel).all()
         db_endpoint_names = {
             record.azure_endpoint_name
             for record in db_records
             if record.azure_endpoint_name
         }
 
-        # Sync any new endpoints from Azure ML to our database
-        for azure_endpoint in azure_endpoints:
-            if (
-                hasattr(azure_endpoint, "name")
-                and azure_endpoint.name not in db_endpoint_names
-            ):
-                # This endpoint exists in Azure ML but not in our database, so add it
-                record = EndpointModel(
-                    user_id=user.user_id,
-                    name=azure_endpoint.name,
-                    azure_endpoint_name=azure_endpoint.name,
-                    azure_endpoint_url=getattr(
-                        azure_endpoint, "azure_endpoint_url", None
-                    ),
-                    auth_mode=getattr(azure_endpoint, "auth_mode", "key"),
-                    provisioning_state=getattr(
-                        azure_endpoint, "provisioning_state", None
-                    ),
-                    description=getattr(azure_endpoint, "description", None),
-                    deployments=getattr(azure_endpoint, "deployments", None),
-                    traffic=getattr(azure_endpoint, "traffic", None),
-                    tags=getattr(azure_endpoint, "tags", None),
-                )
-                db.add(record)
-
-        db.commit()
+        # Sync any new endpoints from Azure ML to our database in one statement
+        new_rows = [
+            {
+                "id": default_uuid(),
+                "user_id": user.user_id,
+                "name": azure_endpoint.name,
+                "azure_endpoint_name": azure_endpoint.name,
+                "azure_endpoint_url": getattr(
+                    azure_endpoint, "azure_endpoint_url", None
+                ),
+                "auth_mode": getattr(azure_endpoint, "auth_mode", "key"),
+                "provisioning_state": getattr(
+                    azure_endpoint, "provisioning_state", None
+                ),
+                "description": getattr(azure_endpoint, "description", None),
+                "deployments": getattr(azure_endpoint, "deployments", None),
+                "traffic": getattr(azure_endpoint, "traffic", None),
+                "tags": getattr(azure_endpoint, "tags", None),
+            }
+            for azure_endpoint in azure_endpoints
+            if hasattr(azure_endpoint, "name")
+            and azure_endpoint.name not in db_endpoint_names
+        ]
+        if new_rows:
+            db.execute(insert(EndpointModel), new_rows)
+            db.commit()
 
-        # Return updated list from database
-        updated_records = db.query(EndpointModel).all()
-        return models_to_schema(updated_records, Endpoint)
+        # Return the rows we already read plus the ones just inserted
+        return models_to_schema([*db_records, *new_rows], Endpoint)
     except Exception:
         # If Azure ML call fails, fall back to database records
-        records = db.query(EndpointModel).all()
-        return models_to_schema(records, Endpoint)
+        return models_to_schema(db_records, Endpoint)
 
 
 @router.get(
@@ -147,8 +238,9 @@ async def list_endpoints(
     operation_id="get_endpoint",
     tags=["mcp"],
 )
-async def get_endpoint(
-    endpoint_id: str = Path(..., description="Endpoint identifier"),
+def get_endpoint(
+    response: Response,
+    record: EndpointModel = Depends(get_endpoint_record),
     user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
     service: AzureAutoMLService = Depends(get_service),
@@ -157,25 +249,29 @@ async def get_endpoint(
 
     Returns the stored endpoint record if present, with updated information from Azure ML.
     """
-    # First try to get from database
-    record = db.get(EndpointModel, endpoint_id)
-    if not record:
-        raise HTTPException(status_code=404, detail="Endpoint not found")
-
     # If we have the Azure endpoint name, try to get fresh data from Azure ML
     if record.azure_endpoint_name:
         try:
-            azure_endpoint = service.get_endpoint(record.azure_endpoint_name)
-
-            # Update database record with fresh Azure ML data
-            record.azure_endpoint_url = azure_endpoint.azure_endpoint_url
-            record.provisioning_state = azure_endpoint.provisioning_state
-            record.deployments = azure_endpoint.deployments
-            record.traffic = azure_endpoint.traffic
-            record.tags = azure_endpoint.tags
+            azure_endpoint = cached_azure_read(
+                ("endpoint", record.azure_endpoint_name),
+                lambda: call_with_timeout(
+                    settings.azure_read_timeout,
+                    service.get_endpoint,
+                    record.azure_endpoint_name,
+                ),
+                response,
+            )
 
-            db.commit()
-            db.refresh(record)
+            # Update database record with fresh Azure ML data, writing only
+            # when something actually changed
+            changed = False
+            for attr in _AZURE_SYNCED_FIELDS:
+                value = getattr(azure_endpoint, attr)
+                if getattr(record, attr) != value:
+                    setattr(record, attr, value)
+                    changed = True
+            if changed:
+                db.commit()
         except Exception:
             # If Azure ML call fails, continue with database data
             pass
@@ -183,13 +279,36 @@ async def get_endpoint(
     return model_to_schema(record, Endpoint)
 
 
+def _delete_endpoint_in_background(
+    bind, service: AzureAutoMLService, endpoint_id: str, azure_endpoint_name: str
+) -> None:
+    """Delete the endpoint from Azure ML, then purge its database record."""
+    try:
+        service.delete_endpoint(azure_endpoint_name)
+        failed = False
+    except Exception as e:
+        logger.error(f"Failed to delete endpoint {azure_endpoint_name}: {e}")
+        failed = True
+
+    with Session(bind=bind) as db:
+        record = db.get(EndpointModel, endpoint_id)
+        if record:
+            if failed:
+                record.provisioning_state = "DeleteFailed"
+            else:
+                db.delete(record)
+            db.commit()
+    invalidate_endpoint_cache(azure_endpoint_name)
+
+
 @router.delete(
     "/endpoints/{endpoint_id}",
     status_code=204,
     operation_id="delete_endpoint",
 )
 @require_maintainer
-async def delete_endpoint(
+def delete_endpoint(
+    background_tasks: BackgroundTasks,
     endpoint_id: str = Path(..., description="Endpoint identifier"),
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -197,27 +316,35 @@ async def delete_endpoint(
 ):
     """Remove a deployment endpoint.
 
-    Deletes the endpoint from both Azure ML and the database.
+    Marks the endpoint as Deleting and removes it from Azure ML in the
+    background; the database record is purged once Azure ML confirms.
+    Repeating the request queues the deletion again, so one that was
+    interrupted can be retried.
     Only MAINTAINERs and ADMINs can delete endpoints.
     """
     record = db.get(EndpointModel, endpoint_id)
     if not record:
         raise HTTPException(status_code=404, detail="Endpoint not found")
 
-    # Delete from Azure ML if we have the Azure endpoint name
-    if record.azure_endpoint_name:
-        try:
-            service.delete_endpoint(record.azure_endpoint_name)
-        except Exception as e:
-            # If Azure ML deletion fails, we'll still remove from database
-            # but return an error message
-            raise HTTPException(
-                status_code=500, detail=f"Failed to delete from Azure ML: {str(e)}"
-            )
+    if not record.azure_endpoint_name:
+        # Nothing to remove in Azure ML, so drop the local record directly
+        db.delete(record)
+        db.commit()
+        invalidate_endpoint_cache()
+        return Response(status_code=204)
 
-    # Delete from database
-    db.delete(record)
+    # Always (re-)queue the Azure ML deletion. It is idempotent, so repeating
+    # the request retries a deletion whose background task died partway.
+    record.provisioning_state = "Deleting"
     db.commit()
+    invalidate_endpoint_cache(record.azure_endpoint_name)
+    background_tasks.add_task(
+        _delete_endpoint_in_background,
+        db.get_bind(),
+        service,
+        record.id,
+        record.azure_endpoint_name,
+    )
     return Response(status_code=204)
 
 
@@ -227,8 +354,8 @@ async def delete_endpoint(
     operation_id="update_endpoint",
     tags=["mcp"],
 )
-async def update_endpoint(
-    endpoint_id: str = Path(..., description="Endpoint identifier"),
+def update_endpoint(
+    record: EndpointModel = Depends(get_endpoint_record),
     description: Optional[str] = None,
     tags: Optional[str] = None,
     user: UserInfo = Depends(get_current_user),
@@ -239,22 +366,21 @@ async def update_endpoint(
 
     Updates the endpoint in both Azure ML and the database.
     """
-    record = db.get(EndpointModel, endpoint_id)
-    if not record:
-        raise HTTPException(status_code=404, detail="Endpoint not found")
 
     # Parse tags if provided
     parsed_tags = None
     if tags:
         try:
-            parsed_tags = json.loads(tags)
-        except json.JSONDecodeError:
+            parsed_tags = orjson.loads(tags)
+        except orjson.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid JSON format for tags")
 
     # Update in Azure ML if we have the Azure endpoint name
     if record.azure_endpoint_name:
         try:
-            azure_endpoint = service.update_endpoint(
+            azure_endpoint = call_with_timeout(
+                settings.azure_operation_timeout,
+                service.update_endpoint,
                 endpoint_name=record.azure_endpoint_name,
                 description=description,
                 tags=parsed_tags,
@@ -278,7 +404,7 @@ async def update_endpoint(
             record.tags = parsed_tags
 
     db.commit()
-    db.refresh(record)
+    invalidate_endpoint_cache(record.azure_endpoint_name)
     return model_to_schema(record, Endpoint)
 
 
@@ -286,23 +412,119 @@ async def update_endpoint(
 async def ws_endpoint_traffic(
     websocket: WebSocket,
     endpoint_id: str = Path(..., description="Endpoint identifier"),
+    db: Session = Depends(get_db),
+    service: AzureAutoMLService = Depends(get_service),
 ):
-    """Stream endpoint traffic metrics.
+    """Stream endpoint traffic.
 
-    Sends basic traffic statistics for the specified endpoint.
+    Sends a JSON frame with the endpoint's traffic split and provisioning state
+    on connect and whenever either changes. All clients watching an endpoint
+    share one Azure ML poll. Clients authenticate with a Bearer token in the
+    Authorization header or the ``token`` query parameter; the socket is closed
+    with code 1008 otherwise.
     """
+    # Authenticate before accepting, so unauthenticated clients never start a poll
+    if authenticate_websocket(websocket, db) is None:
+        db.close()
+        await websocket.close(code=1008)
+        return
+
+    record = db.get(EndpointModel, endpoint_id)
+    azure_endpoint_name = record.azure_endpoint_name if record else None
+    # Release the connection instead of holding it for the socket's lifetime
+    db.close()
+    if not azure_endpoint_name:
+        await websocket.close(code=1008)
+        return
+
+    async def forward_frames():
+        async with traffic_broadcaster.subscribe(
+            azure_endpoint_name, service.get_endpoint_traffic_metrics
+        ) as frames:
+            while True:
+                await websocket.send_text(await frames.get())
+
     await websocket.accept()
-    await websocket.send_text("0")
+    sender = asyncio.create_task(forward_frames())
+    try:
+        # Clients only listen, so the next message received is the disconnect
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        sender.cancel()
+
+
+# Azure ML deployment names: a letter, then letters, digits or hyphens, 3-32
+# characters in all. Names are also used as keys in a JSON path, which this
+# keeps free of quotes and other path syntax.
+DEPLOYMENT_NAME_PATTERN = r"^[A-Za-z][A-Za-z0-9-]{2,31}$"
+
+
+def _set_deployment_entry(
+    db: Session, endpoint_id, deployment_name: str, entry: dict
+) -> None:
+    """Write one deployment entry into the endpoint's JSON column in SQL.
+
+    Only the entry is sent, and concurrent writes to other deployments of the
+    same endpoint don't overwrite each other. The caller commits.
+    """
+    if not re.fullmatch(DEPLOYMENT_NAME_PATTERN, deployment_name):
+        raise ValueError(f"Invalid deployment name: {deployment_name!r}")
+    path = f'$."{deployment_name}"'
+    value = orjson.dumps(entry).decode()
+    current = func.coalesce(EndpointModel.deployments, literal_column("'{}'"))
+    if db.get_bind().dialect.name == "mssql":
+        merged = func.JSON_MODIFY(current, path, func.JSON_QUERY(value))
+    else:
+        merged = func.json_set(current, path, func.json(value))
+    db.execute(
+        update(EndpointModel)
+        .where(EndpointModel.id == endpoint_id)
+        .values(deployments=merged)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _create_deployment_in_background(
+    bind,
+    service: AzureAutoMLService,
+    endpoint_id: str,
+    deployment_name: str,
+    **deployment_kwargs,
+) -> None:
+    """Create the Azure ML deployment and record the outcome on the endpoint."""
+    try:
+        entry = service.create_deployment(
+            deployment_name=deployment_name, **deployment_kwargs
+        )
+    except Exception as e:
+        logger.error(f"Failed to create deployment {deployment_name}: {e}")
+        entry = {
+            "name": deployment_name,
+            "provisioning_state": "Failed",
+            "error": str(e),
+        }
+
+    with Session(bind=bind) as db:
+        _set_deployment_entry(db, endpoint_id, deployment_name, entry)
+        db.commit()
+    invalidate_endpoint_cache(deployment_kwargs["endpoint_name"])
 
 
 @router.post(
     "/endpoints/{endpoint_id}/deployments",
+    status_code=202,
     operation_id="create_deployment",
     tags=["mcp"],
 )
-async def create_deployment(
-    endpoint_id: str = Path(..., description="Endpoint identifier"),
-    deployment_name: str = Form(..., description="Name for the deployment"),
+def create_deployment(
+    background_tasks: BackgroundTasks,
+    record: EndpointModel = Depends(get_endpoint_record),
+    deployment_name: str = Form(
+        ...,
+        pattern=DEPLOYMENT_NAME_PATTERN,
+        description="Name for the deployment (letters, digits and hyphens)",
+    ),
     model_name: str = Form(..., description="Model name to deploy"),
     model_version: Optional[str] = Form(
         None, description="Model version (latest if not specified)"
@@ -318,41 +540,72 @@ async def create_deployment(
 ):
     """Create a deployment for an endpoint.
 
-    Creates a new deployment for the specified endpoint with the given model.
+    Records the deployment as pending and creates it in Azure ML in the
+    background, since provisioning can take many minutes. Poll the returned
+    status URL to follow progress.
     """
-    record = db.get(EndpointModel, endpoint_id)
-    if not record:
-        raise HTTPException(status_code=404, detail="Endpoint not found")
-
     if not record.azure_endpoint_name:
         raise HTTPException(
             status_code=400, detail="Endpoint is not linked to Azure ML"
         )
 
-    try:
-        deployment = service.create_deployment(
-            endpoint_name=record.azure_endpoint_name,
-            deployment_name=deployment_name,
-            model_name=model_name,
-            model_version=model_version,
-            instance_type=instance_type,
-            instance_count=instance_count,
-            traffic_percentage=traffic_percentage,
-        )
+    _set_deployment_entry(
+        db,
+        record.id,
+        deployment_name,
+        {
+            "name": deployment_name,
+            "endpoint_name": record.azure_endpoint_name,
+            "model": model_name,
+            "instance_type": instance_type,
+            "instance_count": instance_count,
+            "provisioning_state": "Creating",
+        },
+    )
+    db.commit()
+    invalidate_endpoint_cache(record.azure_endpoint_name)
+
+    background_tasks.add_task(
+        _create_deployment_in_background,
+        db.get_bind(),
+        service,
+        record.id,
+        deployment_name,
+        endpoint_name=record.azure_endpoint_name,
+        model_name=model_name,
+        model_version=model_version,
+        instance_type=instance_type,
+        instance_count=instance_count,
+        traffic_percentage=traffic_percentage,
+    )
+
+    return {
+        "status": "pending",
+        "deployment_name": deployment_name,
+        "status_url": f"/endpoints/{record.id}/deployments/{deployment_name}/status",
+    }
 
-        # Update the endpoint record with the new deployment info
-        if not record.deployments:
-            record.deployments = {}
-        record.deployments[deployment_name] = deployment
 
-        db.commit()
-        db.refresh(record)
+@router.get(
+    "/endpoints/{endpoint_id}/deployments/{deployment_name}/status",
+    operation_id="get_deployment_creation_status",
+    tags=["mcp"],
+)
+def get_deployment_creation_status(
+    record: EndpointModel = Depends(get_endpoint_record),
+    deployment_name: str = Path(..., description="Deployment name"),
+    user: UserInfo = Depends(get_current_user),
+):
+    """Return the recorded state of a deployment created through this API."""
+    deployment = (record.deployments or {}).get(deployment_name)
+    if deployment is None:
+        raise HTTPException(status_code=404, detail="Deployment not found")
 
-        return {"message": "Deployment created successfully", "deployment": deployment}
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to create deployment: {str(e)}"
-        )
+    return {
+        "deployment_name": deployment_name,
+        "provisioning_state": deployment.get("provisioning_state"),
+        "deployment": deployment,
+    }
 
 
 @router.get(
@@ -360,24 +613,28 @@ async def create_deployment(
     operation_id="list_deployments",
     tags=["mcp"],
 )
-async def list_deployments(
-    endpoint_id: str = Path(..., description="Endpoint identifier"),
+def list_deployments(
+    response: Response,
+    record: EndpointModel = Depends(get_endpoint_record),
     user: UserInfo = Depends(get_current_user),
-    db: Session = Depends(get_db),
     service: AzureAutoMLService = Depends(get_service),
 ):
     """List all deployments for an endpoint."""
-    record = db.get(EndpointModel, endpoint_id)
-    if not record:
-        raise HTTPException(status_code=404, detail="Endpoint not found")
-
     if not record.azure_endpoint_name:
         raise HTTPException(
             status_code=400, detail="Endpoint is not linked to Azure ML"
         )
 
     try:
-        deployments = service.list_endpoint_deployments(record.azure_endpoint_name)
+        deployments = cached_azure_read(
+            ("deployments", record.azure_endpoint_name),
+            lambda: call_with_timeout(
+                settings.azure_read_timeout,
+                service.list_endpoint_deployments,
+                record.azure_endpoint_name,
+            ),
+            response,
+        )
         return {"deployments": deployments}
     except Exception as e:
         raise HTTPException(
@@ -390,8 +647,8 @@ async def list_deployments(
     operation_id="update_traffic",
     tags=["mcp"],
 )
-async def update_traffic(
-    endpoint_id: str = Path(..., description="Endpoint identifier"),
+def update_traffic(
+    record: EndpointModel = Depends(get_endpoint_record),
     traffic_allocation: str = Form(
         ..., description="JSON string of traffic allocation"
     ),
@@ -400,9 +657,6 @@ async def update_traffic(
     service: AzureAutoMLService = Depends(get_service),
 ):
     """Update traffic allocation for an endpoint."""
-    record = db.get(EndpointModel, endpoint_id)
-    if not record:
-        raise HTTPException(status_code=404, detail="Endpoint not found")
 
     if not record.azure_endpoint_name:
         raise HTTPException(
@@ -411,21 +665,24 @@ async def update_traffic(
 
     # Parse traffic allocation
     try:
-        parsed_traffic = json.loads(traffic_allocation)
-    except json.JSONDecodeError:
+        parsed_traffic = orjson.loads(traffic_allocation)
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=400, detail="Invalid JSON format for traffic allocation"
         )
 
     try:
-        updated_traffic = service.update_endpoint_traffic(
-            record.azure_endpoint_name, parsed_traffic
+        updated_traffic = call_with_timeout(
+            settings.azure_operation_timeout,
+            service.update_endpoint_traffic,
+            record.azure_endpoint_name,
+            parsed_traffic,
         )
 
         # Update the database record
         record.traffic = updated_traffic
         db.commit()
-        db.refresh(record)
+        invalidate_endpoint_cache(record.azure_endpoint_name)
 
         return {
             "message": "Traffic allocation updated successfully",
@@ -1,23 +1,36 @@
 """API routes for running AutoML experiments."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Response
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from ..auth import UserInfo, get_current_user, require_maintainer
+from ..config import settings
+from ..cache import TTLCache
 from ..db import get_db
 from ..db.models import Experiment as ExperimentModel
 from ..db.models import Run as RunModel
 from ..schemas.experiment import Experiment
 from ..schemas.run import Run
-from ..services.automl import AzureAutoMLService
-from ..utils import model_to_schema
+from ..services.automl import AzureAutoMLService, get_shared_service
+from ..services.azure_client import call_with_timeout
+from ..utils import (
+    cached_schema_response,
+    delete_record,
+    list_schema_response,
+    model_to_schema,
+    update_record,
+)
 
 router = APIRouter()
 
+# Single-record reads are cached briefly and dropped on writes made here
+_experiment_cache = TTLCache(ttl=30)
+
 
 def get_service() -> AzureAutoMLService:
-    """Provide a fresh service instance for each request."""
-    return AzureAutoMLService()
+    """Provide the shared service instance for each request."""
+    return get_shared_service()
 
 
 @router.post(
@@ -26,7 +39,7 @@ def get_service() -> AzureAutoMLService:
     operation_id="start_experiment",
     tags=["mcp"],
 )
-async def start_experiment(
+def start_experiment(
     exp: Experiment,
     user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -40,27 +53,31 @@ async def start_experiment(
     # Set the user_id to the current authenticated user
     exp.user_id = user.user_id
 
-    run = service.start_experiment(exp)
-    exp_record = ExperimentModel(
-        id=run.experiment_id,
-        user_id=exp.user_id,
-        dataset_id=exp.dataset_id,
-        task_type=exp.task_type,
-        primary_metric=exp.primary_metric,
-        enable_early_termination=str(exp.enable_early_termination).lower()
-        if exp.enable_early_termination is not None
-        else None,
-        exit_score=exp.exit_score,
-        max_concurrent_trials=exp.max_concurrent_trials,
-        max_cores_per_trial=exp.max_cores_per_trial,
-        max_nodes=exp.max_nodes,
-        max_trials=exp.max_trials,
-        timeout_minutes=exp.timeout_minutes,
-        trial_timeout_minutes=exp.trial_timeout_minutes,
+    run = call_with_timeout(
+        settings.azure_operation_timeout, service.start_experiment, exp
+    )
+    # Plain Core inserts skip the ORM unit of work; nothing reads the rows back
+    db.execute(
+        insert(ExperimentModel).values(
+            id=run.experiment_id,
+            user_id=exp.user_id,
+            dataset_id=exp.dataset_id,
+            task_type=exp.task_type,
+            primary_metric=exp.primary_metric,
+            enable_early_termination=str(exp.enable_early_termination).lower()
+            if exp.enable_early_termination is not None
+            else None,
+            exit_score=exp.exit_score,
+            max_concurrent_trials=exp.max_concurrent_trials,
+            max_cores_per_trial=exp.max_cores_per_trial,
+            max_nodes=exp.max_nodes,
+            max_trials=exp.max_trials,
+            timeout_minutes=exp.timeout_minutes,
+            trial_timeout_minutes=exp.trial_timeout_minutes,
+        )
     )
-    db.add(exp_record)
-    db.add(
-        RunModel(
+    db.execute(
+        insert(RunModel).values(
             id=run.id,
             user_id=run.user_id,
             experiment_id=run.experiment_id,  # Use run.experiment_id instead of exp.id
@@ -78,16 +95,18 @@ async def start_experiment(
     operation_id="list_experiments",
     tags=["mcp"],
 )
-async def list_experiments(
+def list_experiments(
+    request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> list[Experiment]:
+) -> Response:
     """List AutoML experiments.
 
     Returns all experiments that have been recorded in the database.
     """
-    records = db.query(ExperimentModel).all()
-    return experiment_models_to_schema(records)
+    return list_schema_response(
+        request, db, select(ExperimentModel.__table__), Experiment
+    )
 
 
 @router.get(
@@ -96,19 +115,26 @@ async def list_experiments(
     operation_id="get_experiment",
     tags=["mcp"],
 )
-async def get_experiment(
+def get_experiment(
+    request: Request,
     experiment_id: str = Path(..., description="Experiment identifier"),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> Experiment:
+) -> Response:
     """Retrieve an experiment.
 
     Returns details about a specific experiment by its ID.
     """
-    record = db.get(ExperimentModel, experiment_id)
-    if not record:
-        raise HTTPException(status_code=404, detail="Experiment not found")
-    return experiment_model_to_schema(record)
+
+    def load() -> Experiment:
+        record = db.get(ExperimentModel, experiment_id)
+        if not record:
+            raise HTTPException(status_code=404, detail="Experiment not found")
+        return model_to_schema(record, Experiment)
+
+    return cached_schema_response(
+        request, _experiment_cache, experiment_id.lower(), load, Experiment
+    )
 
 
 @router.delete(
@@ -117,7 +143,7 @@ async def get_experiment(
     operation_id="delete_experiment",
 )
 @require_maintainer
-async def delete_experiment(
+def delete_experiment(
     experiment_id: str = Path(..., description="Experiment identifier"),
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -127,11 +153,10 @@ async def delete_experiment(
     Removes the experiment record from the database if it exists.
     Only MAINTAINERs and ADMINs can delete experiments.
     """
-    record = db.get(ExperimentModel, experiment_id)
-    if not record:
+    if not delete_record(db, ExperimentModel, experiment_id):
         raise HTTPException(status_code=404, detail="Experiment not found")
-    db.delete(record)
     db.commit()
+    _experiment_cache.pop(experiment_id.lower())
     return Response(status_code=204)
 
 
@@ -140,7 +165,7 @@ async def delete_experiment(
     response_model=Experiment,
     operation_id="update_experiment",
 )
-async def update_experiment(
+def update_experiment(
     exp: Experiment,
     experiment_id: str = Path(..., description="Experiment identifier"),
     user=Depends(get_current_user),
@@ -149,45 +174,18 @@ async def update_experiment(
 ) -> Experiment:
     """Update an experiment record.
 
-    Overwrites stored experiment metadata with the new values provided.
+    Overwrites stored experiment metadata with the fields provided.
     """
-    record = db.get(ExperimentModel, experiment_id)
+    values = exp.model_dump(exclude_unset=True)
+    if values.get("enable_early_termination") is not None:
+        # Stored as 'true'/'false' for cross-database compatibility
+        values["enable_early_termination"] = str(
+            values["enable_early_termination"]
+        ).lower()
+    record = update_record(db, ExperimentModel, experiment_id, values)
     if not record:
         raise HTTPException(status_code=404, detail="Experiment not found")
-    for field, value in exp.model_dump().items():
-        setattr(record, field, value)
     db.commit()
-    db.refresh(record)
+    _experiment_cache.pop(experiment_id.lower())
     return model_to_schema(record, Experiment)
 
-
-def experiment_model_to_schema(model: ExperimentModel) -> Experiment:
-    """Convert ExperimentModel to Experiment schema with proper boolean conversion."""
-    # Convert the model to dict first
-    model_dict = {
-        "id": model.id,
-        "user_id": model.user_id,
-        "dataset_id": model.dataset_id,
-        "task_type": model.task_type,
-        "primary_metric": model.primary_metric,
-        "training_data": None,  # This field doesn't exist in the model
-        "target_column_name": None,  # This field doesn't exist in the model
-        "compute": None,  # This field doesn't exist in the model
-        "n_cross_validations": None,  # This field doesn't exist in the model
-        "enable_early_termination": model.enable_early_termination == "true"
-        if model.enable_early_termination
-        else None,
-        "exit_score": model.exit_score,
-        "max_concurrent_trials": model.max_concurrent_trials,
-        "max_cores_per_trial": model.max_cores_per_trial,
-        "max_nodes": model.max_nodes,
-        "max_trials": model.max_trials,
-        "timeout_minutes": model.timeout_minutes,
-        "trial_timeout_minutes": model.trial_timeout_minutes,
-    }
-    return Experiment(**model_dict)
-
-
-def experiment_models_to_schema(models: list[ExperimentModel]) -> list[Experiment]:
-    """Convert list of ExperimentModel to list of Experiment schemas."""
-    return [experiment_model_to_schema(m) for m in models]
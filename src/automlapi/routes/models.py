@@ -1,23 +1,48 @@
 """API routes for managing model records."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Response
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..auth import UserInfo, get_current_user, require_maintainer
+from ..cache import TTLCache
+from ..config import settings
 from ..db import get_db
 from ..db.models import Model as ModelModel
 from ..schemas.model import Model
-from ..utils import model_to_schema, models_to_schema
+from ..services.automl import AzureAutoMLService, get_shared_service
+from ..services.azure_client import AzureMLClientError, call_with_timeout
+from ..utils import (
+    cached_schema_response,
+    delete_record,
+    list_schema_response,
+    model_to_schema,
+    update_record,
+)
 
 router = APIRouter()
 
+# Single-record reads are cached briefly and dropped on writes made here
+_model_cache = TTLCache(ttl=30)
+
+
+def invalidate_model_cache(model_id) -> None:
+    """Drop the cached read for ``model_id`` after the row changes."""
+    _model_cache.pop(str(model_id).lower())
+
+
+def get_service() -> AzureAutoMLService:
+    """Provide the shared service instance for each request."""
+    return get_shared_service()
+
 
 @router.post(
     "/models",
     response_model=Model,
     operation_id="create_model",
 )
-async def create_model(
+def create_model(
     model: Model,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -29,7 +54,6 @@ async def create_model(
     record = ModelModel(**model.model_dump())
     db.add(record)
     db.commit()
-    db.refresh(record)
     return model_to_schema(record, Model)
 
 
@@ -38,16 +62,16 @@ async def create_model(
     response_model=list[Model],
     operation_id="list_models",
 )
-async def list_models(
+def list_models(
+    request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> list[Model]:
+) -> Response:
     """List registered models.
 
     Returns metadata for all stored model records.
     """
-    records = db.query(ModelModel).all()
-    return models_to_schema(records, Model)
+    return list_schema_response(request, db, select(ModelModel.__table__), Model)
 
 
 @router.get(
@@ -55,19 +79,68 @@ async def list_models(
     response_model=Model,
     operation_id="get_model",
 )
-async def get_model(
+def get_model(
+    request: Request,
     model_id: str = Path(..., description="Model identifier"),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> Model:
+) -> Response:
     """Retrieve a model by ID.
 
     Returns model metadata if the requested record exists.
     """
+
+    def load() -> Model:
+        record = db.get(ModelModel, model_id)
+        if not record:
+            raise HTTPException(status_code=404, detail="Model not found")
+        return model_to_schema(record, Model)
+
+    return cached_schema_response(request, _model_cache, model_id.lower(), load, Model)
+
+
+@router.get(
+    "/models/{model_id}/download",
+    response_class=StreamingResponse,
+    operation_id="download_model",
+)
+def download_model(
+    model_id: str = Path(..., description="Model identifier"),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+    service: AzureAutoMLService = Depends(get_service),
+) -> StreamingResponse:
+    """Download a registered model's files.
+
+    Streams the model from the Azure ML registry in chunks; models made of
+    several files are sent as an uncompressed tar archive.
+    """
     record = db.get(ModelModel, model_id)
     if not record:
         raise HTTPException(status_code=404, detail="Model not found")
-    return model_to_schema(record, Model)
+    if not (record.azure_model_name and record.azure_model_version):
+        raise HTTPException(
+            status_code=400, detail="Model is not registered in Azure ML"
+        )
+
+    try:
+        chunks = call_with_timeout(
+            settings.azure_operation_timeout,
+            service.download_model,
+            record.azure_model_name,
+            record.azure_model_version,
+        )
+    except AzureMLClientError as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to download model: {str(e)}"
+        )
+
+    filename = f"{record.azure_model_name}-{record.azure_model_version}"
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.delete(
@@ -76,7 +149,7 @@ async def get_model(
     operation_id="delete_model",
 )
 @require_maintainer
-async def delete_model(
+def delete_model(
     model_id: str = Path(..., description="Model identifier"),
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -86,11 +159,10 @@ async def delete_model(
     Removes the specified model from the database.
     Only MAINTAINERs and ADMINs can delete models.
     """
-    record = db.get(ModelModel, model_id)
-    if not record:
+    if not delete_record(db, ModelModel, model_id):
         raise HTTPException(status_code=404, detail="Model not found")
-    db.delete(record)
     db.commit()
+    invalidate_model_cache(model_id)
     return Response(status_code=204)
 
 
@@ -99,7 +171,7 @@ async def delete_model(
     response_model=Model,
     operation_id="update_model",
 )
-async def update_model(
+def update_model(
     model: Model,
     model_id: str = Path(..., description="Model identifier"),
     user=Depends(get_current_user),
@@ -109,11 +181,11 @@ async def update_model(
 
     Applies changes to the stored model metadata.
     """
-    record = db.get(ModelModel, model_id)
+    record = update_record(
+        db, ModelModel, model_id, model.model_dump(exclude_unset=True)
+    )
     if not record:
         raise HTTPException(status_code=404, detail="Model not found")
-    for field, value in model.model_dump().items():
-        setattr(record, field, value)
     db.commit()
-    db.refresh(record)
+    invalidate_model_cache(model_id)
     return model_to_schema(record, Model)
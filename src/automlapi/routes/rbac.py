@@ -1,5 +1,8 @@
 """Routes handling RBAC token verification and Azure role assignments."""
 
+import hashlib
+import time
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
@@ -7,9 +10,8 @@ try:
     from jwt.jwks_client import PyJWKClient
 except Exception:  # pragma: no cover - optional dependency
     PyJWKClient = None
-from azure.identity import OnBehalfOfCredential
-from azure.mgmt.authorization import AuthorizationManagementClient
 
+from ..cache import TTLCache
 from ..config import settings
 
 router = APIRouter()
@@ -18,45 +20,74 @@ security = HTTPBearer()
 JWKS_URL = f"https://login.microsoftonline.com/{settings.azure_tenant_id}/discovery/v2.0/keys"
 jwks_client = PyJWKClient(JWKS_URL) if PyJWKClient else None
 
+# Token validation parameters are fixed for the life of the process
+_AUDIENCE = f"api://{settings.azure_client_id}"
+# Azure AD uses either issuer format depending on the token endpoint version
+_ISSUERS = (
+    f"https://login.microsoftonline.com/{settings.azure_tenant_id}/v2.0",
+    f"https://sts.windows.net/{settings.azure_tenant_id}/",
+)
+_ALGS = ("RS256",)
+_SCOPE_SET = frozenset(["access_as_user"])
+
+
+# Verified claims keyed by a digest of the token, so a client repeating the
+# same token skips the RS256 check until the entry (or the token) expires
+_claims_cache = TTLCache(ttl=60)
+
+
+# Signing keys by ``kid``, loaded at startup and refreshed periodically so
+# token checks are a dict lookup. The dict is replaced, never mutated.
+_signing_keys: dict[str, object] = {}
+
+
+def refresh_signing_keys() -> None:
+    """Fetch the tenant's JWKS and replace the cached signing keys."""
+    global _signing_keys
+    keys = jwks_client.get_signing_keys(refresh=True)
+    _signing_keys = {k.key_id: k.key for k in keys}
+
+
+def _key_for_kid(kid: str):
+    """Return the signing key for ``kid``, refetching the JWKS only on a miss.
+
+    A miss means the keys have not loaded yet or Azure AD rotated them.
+    """
+    key = _signing_keys.get(kid)
+    if key is None:
+        refresh_signing_keys()
+        key = _signing_keys[kid]
+    return key
+
 
 def verify_token(auth: HTTPAuthorizationCredentials = Depends(security)) -> str:
     token = auth.credentials
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    claims = _claims_cache.get(digest)
+    if claims is None or claims.get("exp", 0) <= time.time():
+        claims = _decode_claims(token)
+        _claims_cache.set(digest, claims)
+    if _SCOPE_SET.isdisjoint(claims.get("scp", "").split()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing required scope")
+    return token
+
+
+def _decode_claims(token: str) -> dict:
     try:
         if jwks_client is None:
             raise RuntimeError("PyJWKClient unavailable")
-        signing_key = jwks_client.get_signing_key_from_jwt(token).key
-        
-        # Try to decode with different issuer formats (like auth.py does)
-        possible_issuers = [
-            f"https://login.microsoftonline.com/{settings.azure_tenant_id}/v2.0",
-            f"https://sts.windows.net/{settings.azure_tenant_id}/",
-        ]
-        
-        claims = None
-        last_error = None
-        
-        for issuer in possible_issuers:
-            try:
-                claims = jwt.decode(
-                    token,
-                    signing_key,
-                    algorithms=["RS256"],
-                    audience=f"api://{settings.azure_client_id}",
-                    issuer=issuer,
-                )
-                break  # Success, exit the loop
-            except Exception as e:
-                last_error = e
-                continue
-        
-        if claims is None:
-            raise last_error or RuntimeError("Failed to validate token with any known issuer")
-            
+        signing_key = _key_for_kid(jwt.get_unverified_header(token)["kid"])
+        # One signature check covers both accepted issuers
+        claims = jwt.decode(
+            token,
+            signing_key,
+            algorithms=_ALGS,
+            audience=_AUDIENCE,
+            issuer=_ISSUERS,
+        )
     except Exception:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token validation failed")
-    if "access_as_user" not in claims.get("scp", "").split():
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing required scope")
-    return token
+    return claims
 
 
 @router.get(
@@ -68,6 +99,11 @@ def list_assignments(user_token: str = Depends(verify_token)) -> list[dict]:
 
     Uses on-behalf-of flow to query the Management API with the caller's token.
     """
+    # Heavy SDK imports are deferred to this admin-only route so workers start
+    # faster and stay smaller
+    from azure.identity import OnBehalfOfCredential
+    from azure.mgmt.authorization import AuthorizationManagementClient
+
     credential = OnBehalfOfCredential(
         tenant_id=settings.azure_tenant_id,
         client_id=settings.azure_client_id,
@@ -1,16 +1,47 @@
 """API routes for working with experiment runs."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Response, WebSocket
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, WebSocket
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from ..auth import UserInfo, get_current_user, require_maintainer
+from ..auth import (
+    UserInfo,
+    authenticate_websocket,
+    get_current_user,
+    require_maintainer,
+)
+from ..cache import TTLCache
 from ..db import get_db
 from ..db.models import Run as RunModel
 from ..schemas.run import Run
-from ..utils import model_to_schema, models_to_schema
+from ..services.automl import AzureAutoMLService, get_shared_service
+from ..tasks.broadcast import run_status_broadcaster
+from ..utils import (
+    cached_schema_response,
+    delete_record,
+    list_schema_response,
+    model_to_schema,
+    update_record,
+)
 
 router = APIRouter()
 
+# Single-record reads are cached briefly and dropped on every write, including
+# the status updates made by the background run monitor
+_run_cache = TTLCache(ttl=30)
+
+
+def invalidate_run_cache(run_id) -> None:
+    """Drop the cached read for ``run_id`` after the row changes."""
+    _run_cache.pop(str(run_id).lower())
+
+
+def get_service() -> AzureAutoMLService:
+    """Provide the shared service instance for each request."""
+    return get_shared_service()
+
 
 @router.get(
     "/runs",
@@ -18,16 +49,16 @@ router = APIRouter()
     operation_id="list_runs",
     tags=["mcp"],
 )
-async def list_runs(
+def list_runs(
+    request: Request,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> list[Run]:
+) -> Response:
     """List experiment runs.
 
     Returns all run records that exist in the database for the current tenant.
     """
-    records = db.query(RunModel).all()
-    return models_to_schema(records, Run)
+    return list_schema_response(request, db, select(RunModel.__table__), Run)
 
 
 @router.get(
@@ -36,19 +67,28 @@ async def list_runs(
     operation_id="get_run",
     tags=["mcp"],
 )
-async def get_run(
+def get_run(
+    request: Request,
     run_id: str = Path(..., description="Run identifier"),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> Run:
+) -> Response:
     """Get information about a run.
 
     Returns run metadata for the specified run ID.
     """
-    record = db.get(RunModel, run_id)
-    if not record:
-        raise HTTPException(status_code=404, detail="Run not found")
-    return model_to_schema(record, Run)
+
+    def load() -> Run:
+        record = db.get(RunModel, run_id)
+        if not record:
+            raise HTTPException(status_code=404, detail="Run not found")
+        return model_to_schema(record, Run)
+
+    # Run status changes while the job executes, so clients revalidate by ETag
+    # rather than reusing their copy for the cache TTL
+    return cached_schema_response(
+        request, _run_cache, run_id.lower(), load, Run, revalidate=True
+    )
 
 
 @router.delete(
@@ -57,7 +97,7 @@ async def get_run(
     operation_id="delete_run",
 )
 @require_maintainer
-async def delete_run(
+def delete_run(
     run_id: str = Path(..., description="Run identifier"),
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -67,11 +107,10 @@ async def delete_run(
     Removes the run record from the database if found.
     Only MAINTAINERs and ADMINs can delete runs.
     """
-    record = db.get(RunModel, run_id)
-    if not record:
+    if not delete_record(db, RunModel, run_id):
         raise HTTPException(status_code=404, detail="Run not found")
-    db.delete(record)
     db.commit()
+    invalidate_run_cache(run_id)
     return Response(status_code=204)
 
 
@@ -80,7 +119,7 @@ async def delete_run(
     response_model=Run,
     operation_id="update_run",
 )
-async def update_run(
+def update_run(
     run: Run,
     run_id: str = Path(..., description="Run identifier"),
     user=Depends(get_current_user),
@@ -90,23 +129,56 @@ async def update_run(
 
     Applies the provided fields to the stored run entry.
     """
-    record = db.get(RunModel, run_id)
+    record = update_record(
+        db, RunModel, run_id, run.model_dump(exclude_unset=True)
+    )
     if not record:
         raise HTTPException(status_code=404, detail="Run not found")
-    for field, value in run.model_dump().items():
-        setattr(record, field, value)
     db.commit()
-    db.refresh(record)
+    invalidate_run_cache(run_id)
     return model_to_schema(record, Run)
 
 
 @router.websocket("/ws/runs/{run_id}/status", name="ws_run_status")
 async def ws_run_status(
-    websocket: WebSocket, run_id: str = Path(..., description="Run identifier")
+    websocket: WebSocket,
+    run_id: str = Path(..., description="Run identifier"),
+    db: Session = Depends(get_db),
+    service: AzureAutoMLService = Depends(get_service),
 ):
     """Stream run status updates.
 
-    Sends simple text notifications about the run's progress.
+    Sends a JSON frame with the run's Azure ML job status whenever it changes.
+    All clients watching a run share one Azure ML poll. Clients authenticate
+    with a Bearer token in the Authorization header or the ``token`` query
+    parameter; the socket is closed with code 1008 otherwise.
     """
+    # Authenticate before accepting, so unauthenticated clients never start a poll
+    if authenticate_websocket(websocket, db) is None:
+        db.close()
+        await websocket.close(code=1008)
+        return
+
+    record = db.get(RunModel, run_id)
+    job_name = record.job_name if record else None
+    # Release the connection instead of holding it for the socket's lifetime
+    db.close()
+    if not job_name:
+        await websocket.close(code=1008)
+        return
+
+    async def forward_frames():
+        async with run_status_broadcaster.subscribe(
+            job_name, service.get_run_status
+        ) as frames:
+            while True:
+                await websocket.send_text(await frames.get())
+
     await websocket.accept()
-    await websocket.send_text("running")
+    sender = asyncio.create_task(forward_frames())
+    try:
+        # Clients only listen, so the next message received is the disconnect
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        sender.cancel()
@@ -1,16 +1,28 @@
 """API routes for managing users and roles."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import delete, exists, insert, literal, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from ..auth import UserInfo, get_current_user, require_admin
+from ..auth import UserInfo, get_current_user, invalidate_role_cache, require_admin
+from ..cache import TTLCache
 from ..db import get_db
 from ..db.models import Role as RoleModel
 from ..db.models import User as UserModel
 from ..schemas.user import Role, User
+from ..utils import cached_schema_response, delete_record, models_to_schema
 
 router = APIRouter()
 
+# List responses are cached and dropped on writes made here. Roles rarely
+# change, so they are kept longer than users.
+_users_cache = TTLCache(ttl=30)
+_roles_cache = TTLCache(ttl=300)
+# Last good lists, served marked stale while the database is unreachable
+_users_fallback = TTLCache(ttl=86400)
+_roles_fallback = TTLCache(ttl=86400)
+
 
 @router.post(
     "/users",
@@ -18,7 +30,7 @@ router = APIRouter()
     operation_id="create_user",
 )
 @require_admin
-async def create_user(
+def create_user(
     user: User,
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -28,17 +40,23 @@ async def create_user(
     Stores the provided user information in the database.
     Only ADMINs can create users.
     """
-    # Verify the role_id exists if provided
-    if user.role_id:
-        role_exists = db.query(RoleModel).filter(RoleModel.id == user.role_id).first()
-        if not role_exists:
-            raise HTTPException(status_code=400, detail="Invalid role_id")
-
-    record = UserModel(id=user.id, role_id=user.role_id)
-    db.add(record)
+    if user.role_id is None:
+        stmt = insert(UserModel).values(id=user.id)
+    else:
+        # Insert only if the role exists, checked in the same statement
+        stmt = insert(UserModel).from_select(
+            ["id", "role_id"],
+            select(
+                literal(user.id, UserModel.id.type),
+                literal(user.role_id, UserModel.role_id.type),
+            ).where(exists().where(RoleModel.id == user.role_id)),
+        )
+    if db.execute(stmt).rowcount == 0:
+        raise HTTPException(status_code=400, detail="Invalid role_id")
     db.commit()
-    db.refresh(record)
-    return User(**record.__dict__)
+    _users_cache.clear()
+    invalidate_role_cache(user.id)
+    return user
 
 
 @router.get(
@@ -47,16 +65,29 @@ async def create_user(
     operation_id="list_users",
     tags=["mcp"],
 )
-async def list_users(
+def list_users(
+    request: Request,
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> list[User]:
+) -> Response:
     """List users in the system.
 
     Returns every user record from the database.
     """
-    records = db.query(UserModel).all()
-    return [User(**r.__dict__) for r in records]
+
+    def load() -> list[User]:
+        return models_to_schema(db.query(UserModel).all(), User)
+
+    # Lists change with every create or delete, so clients revalidate each time
+    return cached_schema_response(
+        request,
+        _users_cache,
+        "all",
+        load,
+        list[User],
+        revalidate=True,
+        fallback=_users_fallback,
+    )
 
 
 @router.post(
@@ -65,7 +96,7 @@ async def list_users(
     operation_id="create_role",
 )
 @require_admin
-async def create_role(
+def create_role(
     role: Role,
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -75,16 +106,15 @@ async def create_role(
     Adds a new role that can be assigned to users.
     Only ADMINs can create roles.
     """
-    # Check if role name already exists
-    existing_role = db.query(RoleModel).filter(RoleModel.name == role.name).first()
-    if existing_role:
+    # The unique constraint on name rejects duplicates atomically
+    try:
+        db.execute(insert(RoleModel).values(id=role.id, name=role.name))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Role name already exists")
-
-    record = RoleModel(id=role.id, name=role.name)
-    db.add(record)
-    db.commit()
-    db.refresh(record)
-    return Role(**record.__dict__)
+    _roles_cache.clear()
+    return role
 
 
 @router.get(
@@ -92,16 +122,29 @@ async def create_role(
     response_model=list[Role],
     operation_id="list_roles",
 )
-async def list_roles(
+def list_roles(
+    request: Request,
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> list[Role]:
+) -> Response:
     """List all available roles.
 
     Returns all role records from the database.
     """
-    records = db.query(RoleModel).all()
-    return [Role(**r.__dict__) for r in records]
+
+    def load() -> list[Role]:
+        return models_to_schema(db.query(RoleModel).all(), Role)
+
+    # Lists change with every create or delete, so clients revalidate each time
+    return cached_schema_response(
+        request,
+        _roles_cache,
+        "all",
+        load,
+        list[Role],
+        revalidate=True,
+        fallback=_roles_fallback,
+    )
 
 
 @router.delete(
@@ -109,7 +152,7 @@ async def list_roles(
     operation_id="delete_user",
 )
 @require_admin
-async def delete_user(
+def delete_user(
     user_id: str,
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -118,12 +161,11 @@ async def delete_user(
 
     Only ADMINs can delete users.
     """
-    user_record = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if not user_record:
+    if not delete_record(db, UserModel, user_id):
         raise HTTPException(status_code=404, detail="User not found")
-
-    db.delete(user_record)
     db.commit()
+    _users_cache.clear()
+    invalidate_role_cache(user_id)
     return {"message": "User deleted successfully"}
 
 
@@ -132,7 +174,7 @@ async def delete_user(
     operation_id="delete_role",
 )
 @require_admin
-async def delete_role(
+def delete_role(
     role_id: str,
     current_user: UserInfo = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -141,18 +183,17 @@ async def delete_role(
 
     Only ADMINs can delete roles.
     """
-    role_record = db.query(RoleModel).filter(RoleModel.id == role_id).first()
-    if not role_record:
-        raise HTTPException(status_code=404, detail="Role not found")
-
-    # Check if any users are assigned this role
-    users_with_role = db.query(UserModel).filter(UserModel.role_id == role_id).count()
-    if users_with_role > 0:
+    # Delete only if no user holds the role, so the check cannot race an
+    # assignment made between two statements
+    assigned = exists().where(UserModel.role_id == role_id)
+    result = db.execute(delete(RoleModel).where(RoleModel.id == role_id, ~assigned))
+    if result.rowcount == 0:
+        if db.get(RoleModel, role_id) is None:
+            raise HTTPException(status_code=404, detail="Role not found")
         raise HTTPException(
             status_code=400,
             detail="Cannot delete role: users are still assigned to this role",
         )
-
-    db.delete(role_record)
     db.commit()
+    _roles_cache.clear()
     return {"message": "Role deleted successfully"}
@@ -2,12 +2,15 @@
 
 import uvicorn
 
-from automlapi.main import app
-
 
 def main():
-    """Launch the FastAPI app using Uvicorn."""
-    uvicorn.run(app, host="0.0.0.0", port=8005)
+    """Launch the FastAPI app using Uvicorn.
+
+    The app is passed as an import string so Uvicorn can spawn worker
+    processes; set ``WEB_CONCURRENCY`` to choose how many. The uvloop event
+    loop and httptools parser are picked up automatically when installed.
+    """
+    uvicorn.run("automlapi.main:app", host="0.0.0.0", port=8005)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_SIZE = 50
+
+
+class BatchSubRequest(BaseModel):
+    id: str = Field(description="Client-chosen identifier echoed in the response")
+    method: Literal["GET", "POST", "PUT", "DELETE"] = "GET"
+    url: str = Field(description="API path, e.g. /experiments/<id>")
+    body: Optional[Any] = Field(default=None, description="JSON request body")
+
+
+class BatchRequest(BaseModel):
+    requests: list[BatchSubRequest] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class BatchSubResponse(BaseModel):
+    id: str
+    status: int
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    responses: list[BatchSubResponse]
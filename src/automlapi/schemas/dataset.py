@@ -1,10 +1,12 @@
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Dataset(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     uploaded_by: UUID = Field(description="User ID who uploaded the dataset")
     asset_id: Optional[str] = None
@@ -2,10 +2,12 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Deployment(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     user_id: UUID = Field(description="User who created the deployment")
     endpoint_id: UUID = Field(description="Endpoint this deployment belongs to")
@@ -1,12 +1,14 @@
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Experiment(BaseModel):
     """Azure AutoML experiment configuration schema."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID = Field(description="Unique identifier linked to Azure ML experiment")
     user_id: Optional[UUID] = Field(
         None, description="User ID set by server from authenticated user"
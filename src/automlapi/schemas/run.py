@@ -2,10 +2,12 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Run(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     user_id: Optional[UUID] = None  # Will be set by the server from authenticated user
     experiment_id: Optional[UUID] = None
@@ -1,14 +1,18 @@
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Role(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     name: Optional[str] = None
 
 
 class User(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     role_id: Optional[UUID] = None
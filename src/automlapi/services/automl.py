@@ -1,6 +1,8 @@
 """Refactored Azure AutoML service with separated concerns."""
 
-from typing import List, Dict, Any, Optional
+import logging
+from functools import lru_cache
+from typing import List, Dict, Any, BinaryIO, Iterator, Optional, Union
 
 from ..schemas.dataset import Dataset as DatasetSchema
 from ..schemas.endpoint import Endpoint as EndpointSchema
@@ -8,12 +10,16 @@ from ..schemas.experiment import Experiment as ExperimentSchema
 from ..schemas.model import Model as ModelSchema
 from ..schemas.run import Run as RunSchema
 
+from ..config import settings
+from .azure_client import build_ml_client
 from .dataset_service import DatasetService
 from .experiment_service import ExperimentService
 from .endpoint_service import EndpointService
 from .model_service import ModelService
 from .deployment_service import DeploymentService
 
+logger = logging.getLogger(__name__)
+
 
 class AzureAutoMLService:
     """
@@ -28,11 +34,14 @@ class AzureAutoMLService:
     """
     
     def __init__(self):
-        self.datasets = DatasetService()
-        self.experiments = ExperimentService()
-        self.endpoints = EndpointService()
-        self.models = ModelService()
-        self.deployments = DeploymentService()
+        # One MLClient, and so one connection pool, behind every sub-service;
+        # it is also exposed for callers needing SDK operations not wrapped here
+        self.client = build_ml_client()
+        self.datasets = DatasetService(self.client)
+        self.experiments = ExperimentService(self.client)
+        self.endpoints = EndpointService(self.client)
+        self.models = ModelService(self.client)
+        self.deployments = DeploymentService(self.client)
     
     # ========================================
     # Dataset Methods
@@ -42,7 +51,9 @@ class AzureAutoMLService:
         """List all datasets from Azure ML."""
         return self.datasets.list_datasets()
     
-    def upload_dataset(self, dataset_name: str, data: bytes) -> Dict[str, Any]:
+    def upload_dataset(
+        self, dataset_name: str, data: Union[bytes, BinaryIO]
+    ) -> Dict[str, Any]:
         """Upload a dataset to Azure ML as MLTable format."""
         return self.datasets.upload_dataset(dataset_name, data)
     
@@ -66,6 +77,10 @@ class AzureAutoMLService:
         """Get metrics for a specific run."""
         return self.experiments.get_run_metrics(run_id)
     
+    def get_run_status(self, job_name: str) -> Dict[str, Any]:
+        """Get the current status of an Azure ML job."""
+        return self.experiments.get_run_status(job_name)
+    
     def stream_run_logs(self, run_id: str):
         """Yield log lines for a running job."""
         return self.experiments.stream_run_logs(run_id)
@@ -74,6 +89,10 @@ class AzureAutoMLService:
         """Get all child jobs and their scores from an AutoML experiment."""
         return self.experiments.get_child_jobs_with_scores(experiment_name)
     
+    def get_experiment_best_child_job(self, experiment_name: str) -> Optional[Dict[str, Any]]:
+        """Get the best scored child job of an AutoML experiment."""
+        return self.experiments.get_best_child_job(experiment_name)
+    
     def extract_parent_job_metadata(self, parent_job_name: str) -> Dict[str, Any]:
         """Extract metadata from the parent AutoML job."""
         return self.experiments.extract_parent_job_metadata(parent_job_name)
@@ -86,9 +105,9 @@ class AzureAutoMLService:
         """List all models from Azure ML."""
         return self.models.list_models()
     
-    def download_model(self, model_id: str) -> bytes:
-        """Download a model package and return its bytes."""
-        return self.models.download_model(model_id)
+    def download_model(self, model_name: str, model_version: str) -> Iterator[bytes]:
+        """Download a registered model and stream its bytes in chunks."""
+        return self.models.download_model(model_name, model_version)
     
     def register_model_from_job(
         self,
@@ -204,6 +223,10 @@ class AzureAutoMLService:
         """Get performance metrics for a deployment."""
         return self.endpoints.get_deployment_metrics(endpoint_name, deployment_name)
     
+    def get_endpoint_traffic_metrics(self, endpoint_name: str) -> Dict[str, Any]:
+        """Get the current traffic split and state for an endpoint."""
+        return self.endpoints.get_endpoint_traffic_metrics(endpoint_name)
+    
     def create_or_get_endpoint_with_metadata(
         self, 
         endpoint_name: str, 
@@ -262,3 +285,22 @@ class AzureAutoMLService:
     #
     # These methods can be re-added if needed, but the current codebase analysis
     # suggests they are not actively used.
+
+
+@lru_cache(maxsize=1)
+def get_shared_service() -> AzureAutoMLService:
+    """Return the process-wide service so Azure ML clients and tokens are reused."""
+    return AzureAutoMLService()
+
+
+def warm_shared_service() -> None:
+    """Build the shared service and make one cheap Azure ML call with it.
+
+    The call fetches the first access token into the credential's cache and
+    opens a pooled connection, so the first request does not pay for either.
+    """
+    try:
+        service = get_shared_service()
+        service.client.workspaces.get(settings.azure_ml_workspace)
+    except Exception as e:
+        logger.warning(f"Azure ML warm-up failed: {e}")
@@ -1,16 +1,86 @@
 """Core Azure ML client wrapper with common functionality."""
 
+import atexit
+import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict
 from uuid import uuid4
 
+import httpx
+import requests
 from azure.ai.ml import MLClient
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import ClientSecretCredential
+from requests.adapters import HTTPAdapter
+
+try:
+    from azure.ai.ml._azure_environments import EndpointURLS, _convert_arm_to_cli
+except Exception:  # pragma: no cover - private SDK helper may move
+    EndpointURLS = _convert_arm_to_cli = None
 
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+_call_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="azureml-call")
+
+CLOUD_METADATA_CACHE = Path.home() / ".azure_automl" / "cloudEndpoints.json"
+CLOUD_METADATA_TTL = 7 * 24 * 3600
+
+
+def _load_arm_cloud_metadata(metadata_url: str) -> Any:
+    """Return ARM cloud metadata, preferring a fresh copy cached on disk."""
+    try:
+        if time.time() - CLOUD_METADATA_CACHE.stat().st_mtime < CLOUD_METADATA_TTL:
+            cached = json.loads(CLOUD_METADATA_CACHE.read_text())
+            if cached.get("metadata_url") == metadata_url:
+                return cached["clouds"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    clouds = httpx.get(metadata_url, timeout=30).raise_for_status().json()
+    try:
+        CLOUD_METADATA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CLOUD_METADATA_CACHE.write_text(
+            json.dumps({"metadata_url": metadata_url, "clouds": clouds})
+        )
+    except OSError as e:
+        logger.warning(f"Could not cache cloud metadata: {e}")
+    return clouds
+
+
+@lru_cache(maxsize=1)
+def cloud_client_kwargs() -> Dict[str, Any]:
+    """MLClient kwargs describing the cloud named by ``ARM_CLOUD_METADATA_URL``.
+
+    Without them the SDK downloads the metadata on every MLClient
+    construction. Returns no kwargs for the default public cloud.
+    """
+    metadata_url = os.environ.get("ARM_CLOUD_METADATA_URL")
+    if (
+        not metadata_url
+        or os.environ.get("AZUREML_CURRENT_CLOUD")
+        or _convert_arm_to_cli is None
+    ):
+        return {}
+
+    try:
+        clouds = _convert_arm_to_cli(_load_arm_cloud_metadata(metadata_url))
+    except Exception as e:
+        logger.warning(f"Failed to load cloud metadata from {metadata_url}: {e}")
+        return {}
+
+    for cloud_name, cloud_metadata in clouds.items():
+        if cloud_metadata[EndpointURLS.RESOURCE_MANAGER_ENDPOINT] in metadata_url:
+            return {"cloud": cloud_name, "cloud_metadata": cloud_metadata}
+    return {}
+
 
 class AzureMLClientError(Exception):
     """Base exception for Azure ML client operations."""
@@ -18,26 +88,101 @@ class AzureMLClientError(Exception):
     pass
 
 
+def call_with_timeout(timeout: float, func, *args, **kwargs):
+    """Run a blocking Azure ML call, giving up after ``timeout`` seconds.
+
+    The underlying call keeps running in its worker thread; only the caller
+    stops waiting, so a hung Azure request cannot pin the request handler.
+    """
+    future = _call_executor.submit(func, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        raise AzureMLClientError(f"Azure ML call timed out after {timeout:g}s")
+
+
+class CachedTokenCredential:
+    """Wrap a credential and reuse its tokens until shortly before expiry."""
+
+    def __init__(self, credential, refresh_margin: float = 300):
+        self._credential = credential
+        self._refresh_margin = refresh_margin
+        self._tokens: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes, **kwargs):
+        """Return a cached AccessToken for ``scopes``, fetching a new one when near expiry."""
+        if kwargs.get("claims"):
+            # Claims challenges must always reach the identity provider
+            return self._credential.get_token(*scopes, **kwargs)
+
+        key = (scopes, kwargs.get("tenant_id"))
+        token = self._tokens.get(key)
+        if token and token.expires_on - time.time() > self._refresh_margin:
+            return token
+        with self._lock:
+            token = self._tokens.get(key)
+            if not token or token.expires_on - time.time() <= self._refresh_margin:
+                token = self._credential.get_token(*scopes, **kwargs)
+                self._tokens[key] = token
+            return token
+
+    def close(self) -> None:
+        self._credential.close()
+
+
+@lru_cache(maxsize=1)
+def get_credential() -> CachedTokenCredential:
+    """Process-wide service principal credential shared by all Azure ML clients."""
+    return CachedTokenCredential(
+        ClientSecretCredential(
+            tenant_id=settings.azure_tenant_id,
+            client_id=settings.azure_client_id,
+            client_secret=settings.azure_client_secret,
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def get_transport() -> RequestsTransport:
+    """Process-wide HTTP transport shared by every Azure ML pipeline.
+
+    The default requests pool keeps only 10 connections per host, fewer than
+    the threads calling Azure ML concurrently, so extra sockets were closed
+    after each call. Retries stay with azure-core's retry policy.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+    atexit.register(session.close)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+def build_ml_client() -> MLClient:
+    """Create an MLClient for the configured workspace."""
+    try:
+        return MLClient(
+            credential=get_credential(),
+            subscription_id=settings.azure_subscription_id,
+            resource_group_name=settings.azure_ml_resource_group,
+            workspace_name=settings.azure_ml_workspace,
+            transport=get_transport(),
+            **cloud_client_kwargs(),
+        )
+    except Exception as e:
+        logger.error(f"Failed to initialize Azure ML client: {e}")
+        raise AzureMLClientError(f"Failed to initialize Azure ML client: {e}")
+
+
 class AzureMLClient:
     """Wrapper around Azure ML client with common utilities."""
 
-    def __init__(self):
-        """Initialize the Azure ML client with service principal authentication."""
-        try:
-            cred = ClientSecretCredential(
-                tenant_id=settings.azure_tenant_id,
-                client_id=settings.azure_client_id,
-                client_secret=settings.azure_client_secret,
-            )
-            self.client = MLClient(
-                credential=cred,
-                subscription_id=settings.azure_subscription_id,
-                resource_group_name=settings.azure_ml_resource_group,
-                workspace_name=settings.azure_ml_workspace,
-            )
-        except Exception as e:
-            logger.error(f"Failed to initialize Azure ML client: {e}")
-            raise AzureMLClientError(f"Failed to initialize Azure ML client: {e}")
+    def __init__(self, client: MLClient | None = None):
+        """Use ``client``, or build one with service principal authentication.
+
+        Services created together should share one client, and with it one
+        HTTP connection pool.
+        """
+        self.client = client if client is not None else build_ml_client()
 
     def generate_uuid(self) -> str:
         """Generate a UUID string for internal tracking."""
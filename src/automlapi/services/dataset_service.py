@@ -1,8 +1,9 @@
 """Dataset management service for Azure ML."""
 
 import os
+import shutil
 import tempfile
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, List, Union
 
 from azure.ai.ml.constants import AssetTypes
 from azure.ai.ml.entities import Data
@@ -10,6 +11,9 @@ from azure.ai.ml.entities import Data
 from ..schemas.dataset import Dataset as DatasetSchema
 from .azure_client import AzureMLClient, AzureMLClientError
 
+# Chunk size used when copying an uploaded file object to the staging directory
+COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class DatasetService(AzureMLClient):
     """Service for managing datasets in Azure ML."""
@@ -17,18 +21,29 @@ class DatasetService(AzureMLClient):
     def list_datasets(self) -> List[DatasetSchema]:
         """List all datasets from Azure ML."""
         try:
-            datasets = list(self.client.data.list())
-            return [self._convert_to_schema(dataset) for dataset in datasets]
+            # Convert page by page as the SDK pager fetches them
+            return [
+                self._convert_to_schema(dataset) for dataset in self.client.data.list()
+            ]
         except Exception as e:
             raise AzureMLClientError(f"Failed to list datasets: {e}")
 
-    def upload_dataset(self, dataset_name: str, data: bytes) -> Dict[str, Any]:
-        """Upload a dataset to Azure ML as MLTable format for AutoML compatibility."""
+    def upload_dataset(
+        self, dataset_name: str, data: Union[bytes, BinaryIO]
+    ) -> Dict[str, Any]:
+        """Upload a dataset to Azure ML as MLTable format for AutoML compatibility.
+
+        ``data`` may be the raw bytes or a binary file object, which is copied
+        to disk in chunks rather than read into memory first.
+        """
         with tempfile.TemporaryDirectory() as tmp_dir:
             # Create the dataset CSV file
             csv_file_path = os.path.join(tmp_dir, "dataset.csv")
             with open(csv_file_path, "wb") as f:
-                f.write(data)
+                if isinstance(data, (bytes, bytearray, memoryview)):
+                    f.write(data)
+                else:
+                    shutil.copyfileobj(data, f, COPY_CHUNK_SIZE)
 
             # Create MLTable YAML file for AutoML compatibility
             mltable_content = """$schema: https://azuremlschemas.azureedge.net/latest/MLTable.schema.json
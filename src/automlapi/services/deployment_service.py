@@ -3,9 +3,10 @@
 import logging
 from typing import Any, Dict, Optional
 
+from azure.ai.ml import MLClient
 from azure.ai.ml.entities import ManagedOnlineDeployment
 
-from .azure_client import AzureMLClientError
+from .azure_client import AzureMLClientError, build_ml_client
 from .endpoint_service import EndpointService
 from .experiment_service import ExperimentService
 from .model_service import ModelService
@@ -16,10 +17,11 @@ logger = logging.getLogger(__name__)
 class DeploymentService:
     """Service for orchestrating model deployments."""
 
-    def __init__(self):
-        self.model_service = ModelService()
-        self.endpoint_service = EndpointService()
-        self.experiment_service = ExperimentService()
+    def __init__(self, client: MLClient | None = None):
+        client = client if client is not None else build_ml_client()
+        self.model_service = ModelService(client)
+        self.endpoint_service = EndpointService(client)
+        self.experiment_service = ExperimentService(client)
 
     def deploy_best_model_from_experiment(
         self,
@@ -39,18 +41,14 @@ class DeploymentService:
                 experiment_name
             )
 
-            # Get child jobs with scores
-            jobs_with_scores = self.experiment_service.get_child_jobs_with_scores(
-                experiment_name
-            )
+            # Get the best scored child job and extract its metadata
+            best_job = self.experiment_service.get_best_child_job(experiment_name)
 
-            if not jobs_with_scores:
+            if best_job is None:
                 raise AzureMLClientError(
                     f"No jobs with scores found for experiment {experiment_name}"
                 )
 
-            # Get the best job and extract its metadata
-            best_job = jobs_with_scores[0]
             best_model_metadata = self.model_service.extract_best_model_metadata(
                 best_job["name"], best_job
             )
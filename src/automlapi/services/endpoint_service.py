@@ -1,15 +1,22 @@
 """Endpoint and deployment management service for Azure ML."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 from azure.ai.ml.entities import ManagedOnlineDeployment, ManagedOnlineEndpoint
+from azure.core.exceptions import ResourceNotFoundError
 
 from ..schemas.endpoint import Endpoint as EndpointSchema
+from ..utils import models_to_schema
 from .azure_client import AzureMLClient, AzureMLClientError
 
 logger = logging.getLogger(__name__)
 
+# Runs independent Azure ML reads side by side so a request waits for the
+# slowest call rather than the sum of them.
+_read_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="azureml-read")
+
 
 class EndpointService(AzureMLClient):
     """Service for managing endpoints and deployments in Azure ML."""
@@ -17,8 +24,14 @@ class EndpointService(AzureMLClient):
     def list_endpoints(self) -> List[EndpointSchema]:
         """List all online endpoints from Azure ML."""
         try:
-            endpoints = list(self.client.online_endpoints.list())
-            return [self._convert_to_schema(endpoint) for endpoint in endpoints]
+            # Convert page by page as the SDK pager fetches them
+            return models_to_schema(
+                (
+                    self._endpoint_to_dict(endpoint)
+                    for endpoint in self.client.online_endpoints.list()
+                ),
+                EndpointSchema,
+            )
         except Exception as e:
             raise AzureMLClientError(f"Failed to list endpoints: {e}")
 
@@ -48,10 +61,12 @@ class EndpointService(AzureMLClient):
     def get_endpoint(self, endpoint_name: str) -> EndpointSchema:
         """Get an Azure ML online endpoint by name."""
         try:
+            # Fetch deployment information while the endpoint itself is loading
+            deployments_future = _read_executor.submit(
+                self._get_endpoint_deployments, endpoint_name
+            )
             endpoint = self.client.online_endpoints.get(endpoint_name)
-
-            # Get deployment information
-            deployments = self._get_endpoint_deployments(endpoint_name)
+            deployments = deployments_future.result()
             traffic = self.safe_getattr(endpoint, "traffic", {})
 
             # Update deployment traffic percentages
@@ -102,7 +117,11 @@ class EndpointService(AzureMLClient):
             raise AzureMLClientError(f"Failed to update endpoint {endpoint_name}: {e}")
 
     def delete_endpoint(self, endpoint_name: str) -> bool:
-        """Delete an Azure ML online endpoint."""
+        """Delete an Azure ML online endpoint.
+
+        An endpoint that no longer exists counts as deleted, so retrying an
+        interrupted deletion succeeds.
+        """
         try:
             self.handle_azure_operation(
                 f"delete_endpoint_{endpoint_name}",
@@ -111,6 +130,9 @@ class EndpointService(AzureMLClient):
             )
             return True
         except Exception as e:
+            # handle_azure_operation re-raises, keeping the SDK error as context
+            if isinstance(e.__context__, ResourceNotFoundError):
+                return True
             raise AzureMLClientError(f"Failed to delete endpoint {endpoint_name}: {e}")
 
     def create_deployment(
@@ -262,6 +284,20 @@ class EndpointService(AzureMLClient):
                 f"Failed to get deployment metrics for {deployment_name}: {e}"
             )
 
+    def get_endpoint_traffic_metrics(self, endpoint_name: str) -> Dict[str, Any]:
+        """Get the current traffic split and state for an endpoint."""
+        try:
+            endpoint = self.client.online_endpoints.get(endpoint_name)
+            return {
+                "endpoint_name": endpoint_name,
+                "provisioning_state": self.safe_getattr(endpoint, "provisioning_state"),
+                "traffic": self.safe_getattr(endpoint, "traffic") or {},
+            }
+        except Exception as e:
+            raise AzureMLClientError(
+                f"Failed to get traffic metrics for {endpoint_name}: {e}"
+            )
+
     def create_or_get_endpoint_with_metadata(
         self, endpoint_name: str, metadata: Dict[str, Any] = None
     ) -> str:
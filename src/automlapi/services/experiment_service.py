@@ -1,6 +1,6 @@
 """Experiment and job management service for Azure ML."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from azure.ai.ml import Input, automl, command
@@ -9,8 +9,12 @@ from azure.ai.ml.entities import ResourceConfiguration
 
 from ..schemas.experiment import Experiment as ExperimentSchema
 from ..schemas.run import Run as RunSchema
+from ..utils import models_to_schema
 from .azure_client import AzureMLClient, AzureMLClientError
 
+# Key under which AutoML records the best child run on the parent job
+BEST_CHILD_RUN_KEY = "automl_best_child_run_id"
+
 
 class ExperimentService(AzureMLClient):
     """Service for managing AutoML experiments and jobs."""
@@ -18,16 +22,22 @@ class ExperimentService(AzureMLClient):
     def list_experiments(self) -> List[ExperimentSchema]:
         """List all experiments (jobs) from Azure ML."""
         try:
-            jobs = list(self.client.jobs.list())
-            return [self._convert_job_to_experiment_schema(job) for job in jobs]
+            # Convert page by page as the SDK pager fetches them, validating
+            # every row with one cached adapter
+            return models_to_schema(
+                (self._job_to_experiment_dict(job) for job in self.client.jobs.list()),
+                ExperimentSchema,
+            )
         except Exception as e:
             raise AzureMLClientError(f"Failed to list experiments: {e}")
 
     def list_runs(self) -> List[RunSchema]:
         """List all runs (jobs) from Azure ML."""
         try:
-            jobs = list(self.client.jobs.list())
-            return [self._convert_job_to_run_schema(job) for job in jobs]
+            return models_to_schema(
+                (self._job_to_run_dict(job) for job in self.client.jobs.list()),
+                RunSchema,
+            )
         except Exception as e:
             raise AzureMLClientError(f"Failed to list runs: {e}")
 
@@ -70,6 +80,17 @@ class ExperimentService(AzureMLClient):
         except Exception as e:
             raise AzureMLClientError(f"Failed to get run metrics for {run_id}: {e}")
 
+    def get_run_status(self, job_name: str) -> Dict[str, Any]:
+        """Get the current status of an Azure ML job."""
+        try:
+            job = self.client.jobs.get(job_name)
+            return {
+                "job_name": job_name,
+                "status": self.safe_getattr(job, "status"),
+            }
+        except Exception as e:
+            raise AzureMLClientError(f"Failed to get status for {job_name}: {e}")
+
     def stream_run_logs(self, run_id: str):
         """Yield log lines for a running job."""
         try:
@@ -81,10 +102,11 @@ class ExperimentService(AzureMLClient):
     def get_child_jobs_with_scores(self, experiment_name: str) -> List[Dict[str, Any]]:
         """Get all child jobs and their scores from an AutoML experiment."""
         try:
-            child_jobs = list(self.client.jobs.list(parent_job_name=experiment_name))
+            # Scores come from the listed jobs' properties, so the children are
+            # read page by page without a per-child GET
             jobs_with_scores = []
 
-            for job in child_jobs:
+            for job in self.client.jobs.list(parent_job_name=experiment_name):
                 job_info = self._extract_job_performance_info(job)
                 if job_info.get("score") is not None:
                     jobs_with_scores.append(job_info)
@@ -98,6 +120,38 @@ class ExperimentService(AzureMLClient):
                 f"Failed to get child jobs for {experiment_name}: {e}"
             )
 
+    def get_best_child_job(self, experiment_name: str) -> Optional[Dict[str, Any]]:
+        """Get the best scored child job of an AutoML experiment.
+
+        AutoML records its best child on the parent job, so that child is
+        fetched directly. Otherwise the children are scanned once for the
+        highest score, without sorting them all.
+        """
+        try:
+            parent_job = self.client.jobs.get(experiment_name)
+            best_child_name = self._best_child_name(parent_job)
+            if best_child_name:
+                job_info = self._extract_job_performance_info(
+                    self.client.jobs.get(best_child_name)
+                )
+                if job_info.get("score") is not None:
+                    return job_info
+
+            scored = (
+                job_info
+                for job_info in map(
+                    self._extract_job_performance_info,
+                    self.client.jobs.list(parent_job_name=experiment_name),
+                )
+                if job_info.get("score") is not None
+            )
+            return max(scored, key=lambda x: x["score"], default=None)
+
+        except Exception as e:
+            raise AzureMLClientError(
+                f"Failed to get best child job for {experiment_name}: {e}"
+            )
+
     def extract_parent_job_metadata(self, parent_job_name: str) -> Dict[str, Any]:
         """Extract metadata from the parent AutoML job."""
         try:
@@ -216,6 +270,14 @@ class ExperimentService(AzureMLClient):
                 trial_timeout_minutes=config.trial_timeout_minutes,
             )
 
+    def _best_child_name(self, parent_job) -> Optional[str]:
+        """Return the best child run AutoML recorded on ``parent_job``, if any."""
+        for attr in ("tags", "properties"):
+            values = self.safe_getattr(parent_job, attr, {}) or {}
+            if values.get(BEST_CHILD_RUN_KEY):
+                return str(values[BEST_CHILD_RUN_KEY])
+        return None
+
     def _extract_job_performance_info(self, job) -> Dict[str, Any]:
         """Extract performance information from a job."""
         job_info = {
@@ -261,18 +323,18 @@ class ExperimentService(AzureMLClient):
 
         return job_info
 
-    def _convert_job_to_experiment_schema(self, job) -> ExperimentSchema:
-        """Convert Azure ML job to experiment schema."""
+    def _job_to_experiment_dict(self, job) -> Dict[str, Any]:
+        """Convert Azure ML job to dictionary for experiment schema creation."""
         # This would need proper implementation based on ExperimentSchema
-        return ExperimentSchema(
-            id=self.generate_uuid(),
-            task_type=self.safe_getattr(job, "task_type", "unknown"),
-        )
+        return {
+            "id": self.generate_uuid(),
+            "task_type": self.safe_getattr(job, "task_type", "unknown"),
+        }
 
-    def _convert_job_to_run_schema(self, job) -> RunSchema:
-        """Convert Azure ML job to run schema."""
+    def _job_to_run_dict(self, job) -> Dict[str, Any]:
+        """Convert Azure ML job to dictionary for run schema creation."""
         # This would need proper implementation based on RunSchema
-        return RunSchema(
-            id=self.generate_uuid(),
-            job_name=self.safe_getattr(job, "name"),
-        )
+        return {
+            "id": self.generate_uuid(),
+            "job_name": self.safe_getattr(job, "name"),
+        }
@@ -1,8 +1,12 @@
 """Model management and deployment service for Azure ML."""
 
 import logging
+import os
+import tarfile
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from azure.ai.ml.entities import Model
 
@@ -11,6 +15,9 @@ from .azure_client import AzureMLClient, AzureMLClientError
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when streaming downloaded model files back to the caller
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class ModelService(AzureMLClient):
     """Service for managing models and model registration in Azure ML."""
@@ -18,31 +25,76 @@ class ModelService(AzureMLClient):
     def list_models(self) -> List[ModelSchema]:
         """List all models from Azure ML."""
         try:
-            models = list(self.client.models.list())
-            return [self._convert_to_schema(model) for model in models]
+            # Convert page by page as the SDK pager fetches them
+            return [
+                self._convert_to_schema(model) for model in self.client.models.list()
+            ]
         except Exception as e:
             raise AzureMLClientError(f"Failed to list models: {e}")
 
-    def download_model(self, model_id: str) -> bytes:
-        """Download a model package and return its bytes."""
-        import os
-        import tempfile
+    def download_model(self, model_name: str, model_version: str) -> Iterator[bytes]:
+        """Download a registered model and stream it back in chunks.
 
+        A single-file model is streamed as is; a model with several files is
+        streamed as an uncompressed tar archive. The download is staged in a
+        temporary directory that is removed once the stream is exhausted or
+        closed.
+        """
+        tmp_dir = tempfile.TemporaryDirectory()
         try:
-            tmp_dir = tempfile.mkdtemp()
-            self.client.models.download(name=model_id, download_path=tmp_dir)
-
-            # Find and return the first file
-            for root, _, files in os.walk(tmp_dir):
-                for f in files:
-                    path = os.path.join(root, f)
-                    with open(path, "rb") as fp:
-                        return fp.read()
-
-            return b""
-
+            self.client.models.download(
+                name=model_name, version=model_version, download_path=tmp_dir.name
+            )
+            paths = [
+                os.path.join(root, f)
+                for root, _, files in os.walk(tmp_dir.name)
+                for f in sorted(files)
+            ]
         except Exception as e:
-            raise AzureMLClientError(f"Failed to download model {model_id}: {e}")
+            tmp_dir.cleanup()
+            raise AzureMLClientError(
+                f"Failed to download model {model_name}:{model_version}: {e}"
+            )
+
+        return self._stream_download(tmp_dir, paths)
+
+    @staticmethod
+    def _stream_download(
+        tmp_dir: tempfile.TemporaryDirectory, paths: List[str]
+    ) -> Iterator[bytes]:
+        """Yield the downloaded files in chunks, then remove ``tmp_dir``."""
+        with tmp_dir:
+            if len(paths) == 1:
+                with open(paths[0], "rb") as fp:
+                    while chunk := fp.read(DOWNLOAD_CHUNK_SIZE):
+                        yield chunk
+                return
+            if not paths:
+                return
+
+            # Tar the files through a pipe so only one chunk is held at a time
+            read_fd, write_fd = os.pipe()
+            errors: List[BaseException] = []
+
+            def write_tar() -> None:
+                try:
+                    with os.fdopen(write_fd, "wb") as out:
+                        with tarfile.open(mode="w|", fileobj=out) as tar:
+                            for path in paths:
+                                tar.add(path, os.path.relpath(path, tmp_dir.name))
+                except BaseException as e:  # surfaced to the reader below
+                    errors.append(e)
+
+            writer = threading.Thread(target=write_tar, daemon=True)
+            writer.start()
+            try:
+                with os.fdopen(read_fd, "rb") as pipe:
+                    while chunk := pipe.read(DOWNLOAD_CHUNK_SIZE):
+                        yield chunk
+            finally:
+                writer.join()
+            if errors:
+                raise AzureMLClientError(f"Failed to stream model files: {errors[0]}")
 
     def register_model_from_job(
         self,
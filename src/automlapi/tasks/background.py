@@ -2,19 +2,20 @@ import asyncio
 
 from datetime import datetime
 
-from ..services.automl import AzureAutoMLService
+from ..services.automl import get_shared_service
 from ..db import db_manager
 from ..db.models import Run as RunModel, Dataset as DatasetModel
+from ..routes.runs import invalidate_run_cache
 
 
 async def monitor_run(run_id: str) -> None:
     """Periodically check run metrics until completion."""
-    service = AzureAutoMLService()
+    service = get_shared_service()
     SessionLocal = db_manager.get_session_local()
     db = SessionLocal()
     try:
         while True:
-            metrics = service.get_run_metrics(run_id)
+            metrics = await asyncio.to_thread(service.get_run_metrics, run_id)
             status = metrics.get("status") if isinstance(metrics, dict) else None
             record = db.get(RunModel, run_id)
             if record:
@@ -22,8 +23,10 @@ async def monitor_run(run_id: str) -> None:
                 if status in {"Completed", "Failed", "Canceled"}:
                     record.completed_at = datetime.utcnow()
                     db.commit()
+                    invalidate_run_cache(run_id)
                     break
                 db.commit()
+                invalidate_run_cache(run_id)
             if status in {"Completed", "Failed", "Canceled"}:
                 break
             await asyncio.sleep(30)
@@ -33,8 +36,8 @@ async def monitor_run(run_id: str) -> None:
 
 async def profile_dataset(dataset_id: str) -> None:
     """Trigger dataset profiling by submitting a job."""
-    service = AzureAutoMLService()
-    service.client.data.import_data(name=dataset_id)
+    service = get_shared_service()
+    await asyncio.to_thread(service.client.data.import_data, name=dataset_id)
     SessionLocal = db_manager.get_session_local()
     db = SessionLocal()
     try:
@@ -49,7 +52,7 @@ async def profile_dataset(dataset_id: str) -> None:
 
 async def collect_endpoint_metrics() -> None:
     """Continuously collect endpoint metrics for monitoring."""
-    service = AzureAutoMLService()
+    service = get_shared_service()
     while True:
-        service.list_endpoints()
+        await asyncio.to_thread(service.list_endpoints)
         await asyncio.sleep(60)
@@ -0,0 +1,70 @@
+"""Fan out polled Azure ML state to WebSocket subscribers."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class PollingBroadcaster:
+    """Poll each watched key once per interval and share the result.
+
+    A poller task runs per key only while it has subscribers, so any number of
+    connected clients costs a single upstream Azure ML call per interval. Frames
+    are pushed only when the polled state changes.
+    """
+
+    def __init__(self, key_field: str, interval: float = 5.0):
+        self.key_field = key_field
+        self.interval = interval
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._pollers: dict[str, asyncio.Task] = {}
+        self._last_frames: dict[str, str] = {}
+
+    @asynccontextmanager
+    async def subscribe(
+        self, key: str, fetch: Callable[[str], Dict[str, Any]]
+    ) -> AsyncIterator[asyncio.Queue]:
+        """Yield a queue receiving encoded JSON frames for ``key``."""
+        # Only the latest frame matters, so slow clients skip stale ones
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if key in self._last_frames:
+            queue.put_nowait(self._last_frames[key])
+        subscribers = self._subscribers.setdefault(key, set())
+        subscribers.add(queue)
+        if key not in self._pollers:
+            self._pollers[key] = asyncio.create_task(self._poll(key, fetch))
+        try:
+            yield queue
+        finally:
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[key]
+                self._last_frames.pop(key, None)
+                self._pollers.pop(key).cancel()
+
+    async def _poll(self, key: str, fetch: Callable[[str], Dict[str, Any]]) -> None:
+        while True:
+            try:
+                data = await asyncio.to_thread(fetch, key)
+            except Exception as e:
+                logger.warning(f"Poll failed for {self.key_field} {key}: {e}")
+                data = {self.key_field: key, "error": str(e)}
+
+            # Encode once for every subscriber, and skip unchanged state
+            frame = orjson.dumps(data).decode()
+            if frame != self._last_frames.get(key):
+                self._last_frames[key] = frame
+                for queue in self._subscribers.get(key, ()):
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait(frame)
+            await asyncio.sleep(self.interval)
+
+
+traffic_broadcaster = PollingBroadcaster("endpoint_name", interval=5.0)
+run_status_broadcaster = PollingBroadcaster("job_name", interval=10.0)
@@ -1,8 +1,17 @@
 """Utility helpers for working with SQLAlchemy models and Pydantic schemas."""
 
-from typing import Iterable, Type, TypeVar
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Callable, Hashable, Iterable, Iterator, Type, TypeVar
 
-from pydantic import BaseModel
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select, delete, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from ..cache import TTLCache
 
 ModelT = TypeVar("ModelT")
 SchemaT = TypeVar("SchemaT", bound=BaseModel)
@@ -13,6 +22,148 @@ def model_to_schema(model: ModelT, schema_cls: Type[SchemaT]) -> SchemaT:
     return schema_cls.model_validate(model, from_attributes=True)
 
 
+@lru_cache(maxsize=None)
+def _adapter(schema_type: Any) -> TypeAdapter:
+    """Build the validator/serializer for ``schema_type`` once per type."""
+    return TypeAdapter(schema_type)
+
+
 def models_to_schema(models: Iterable[ModelT], schema_cls: Type[SchemaT]) -> list[SchemaT]:
-    """Convert an iterable of SQLAlchemy models to a list of Pydantic schemas."""
-    return [model_to_schema(m, schema_cls) for m in models]
+    """Convert SQLAlchemy models or row mappings to a list of Pydantic schemas."""
+    return _adapter(list[schema_cls]).validate_python(models, from_attributes=True)
+
+
+def schema_response(content: Any, schema_type: Any) -> Response:
+    """Serialize already-validated schemas straight to a JSON response.
+
+    Returning a ``Response`` skips FastAPI's second validation pass against the
+    route's ``response_model``, which is still used for the OpenAPI schema.
+    """
+    return Response(
+        _adapter(schema_type).dump_json(content), media_type="application/json"
+    )
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def list_schema_response(
+    request: Request, db: Session, stmt: Select, schema_cls: Type[SchemaT]
+) -> Response:
+    """Serve the rows of ``stmt`` as a JSON array, or as NDJSON on request.
+
+    Clients sending ``Accept: application/x-ndjson`` get one JSON object per
+    line, encoded as the body is sent rather than as one large document. Other
+    clients get the usual array with a ``Link`` header advertising the
+    streaming form. Either way the query runs and its rows are validated in
+    the request session before the response starts, so errors surface as a
+    500 rather than a truncated body.
+    """
+    items = models_to_schema(db.execute(stmt).mappings().all(), schema_cls)
+    if NDJSON_MEDIA_TYPE not in request.headers.get("accept", ""):
+        response = schema_response(items, list[schema_cls])
+        response.headers["Link"] = (
+            f'<{request.url.path}>; rel="alternate"; type="{NDJSON_MEDIA_TYPE}"'
+        )
+        return response
+
+    adapter = _adapter(schema_cls)
+
+    def lines() -> Iterator[bytes]:
+        # Rows are already validated, so only encoding happens mid-stream
+        for item in items:
+            yield adapter.dump_json(item) + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's ``If-None-Match`` covers ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return any(
+        tag.strip().removeprefix("W/") in (etag, "*") for tag in header.split(",")
+    )
+
+
+def cached_schema_response(
+    request: Request,
+    cache: TTLCache,
+    key: Hashable,
+    load: Callable[[], Any],
+    schema_type: Any,
+    revalidate: bool = False,
+    fallback: TTLCache | None = None,
+) -> Response:
+    """Serve ``load()`` as JSON, caching the encoded body under ``key``.
+
+    A hit skips the database and serialization entirely. Exceptions raised by
+    ``load`` (such as a 404) are not cached. Clients may reuse the body for the
+    cache's TTL, or with ``revalidate`` must check back every time, and may
+    revalidate with ``If-None-Match`` against the ETag, which is a hash of the
+    body; a match gets an empty 304.
+
+    With a ``fallback`` cache, every freshly loaded body is also kept there,
+    and is served with an ``X-Stale: true`` header if the database cannot be
+    reached.
+    """
+
+    def encode() -> tuple[bytes, str]:
+        body = _adapter(schema_type).dump_json(load())
+        entry = body, f'"{blake2b(body, digest_size=8).hexdigest()}"'
+        if fallback is not None:
+            fallback.set(key, entry)
+        return entry
+
+    try:
+        body, etag = cache.get_or_set(key, encode)
+    except OperationalError:
+        entry = fallback.get(key) if fallback is not None else None
+        if entry is None:
+            raise
+        return Response(
+            entry[0],
+            media_type="application/json",
+            headers={"Cache-Control": "no-store", "X-Stale": "true"},
+        )
+
+    if revalidate:
+        cache_control = "private, no-cache"
+    else:
+        cache_control = f"private, max-age={int(cache.ttl)}"
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def update_record(
+    db: Session, model_cls: Type[ModelT], record_id: Any, values: dict[str, Any]
+) -> ModelT | None:
+    """Apply ``values`` to one row with ``UPDATE ... RETURNING``.
+
+    Keys that are not columns of ``model_cls`` (or are the primary key) are
+    ignored. Returns the updated instance, or ``None`` if no row matched. The
+    caller commits.
+    """
+    columns = model_cls.__table__.c
+    values = {k: v for k, v in values.items() if k in columns and k != "id"}
+    if not values:
+        return db.get(model_cls, record_id)
+    stmt = (
+        update(model_cls)
+        .where(model_cls.id == record_id)
+        .values(**values)
+        .returning(model_cls)
+    )
+    return db.scalars(stmt).one_or_none()
+
+
+def delete_record(db: Session, model_cls: Type[ModelT], record_id: Any) -> bool:
+    """Delete one row by primary key in a single statement.
+
+    Returns ``False`` if no row matched. The caller commits.
+    """
+    result = db.execute(delete(model_cls).where(model_cls.id == record_id))
+    return result.rowcount > 0
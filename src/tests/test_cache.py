@@ -0,0 +1,31 @@
+from unittest.mock import MagicMock, patch
+
+from automlapi.cache import TTLCache
+
+
+def test_get_or_set_caches_until_expiry():
+    cache = TTLCache(ttl=10)
+    factory = MagicMock(return_value={"state": "Succeeded"})
+
+    with patch("automlapi.cache.time.monotonic", return_value=100.0):
+        assert cache.get_or_set("key", factory) == {"state": "Succeeded"}
+        assert cache.get_or_set("key", factory) == {"state": "Succeeded"}
+    assert factory.call_count == 1
+
+    with patch("automlapi.cache.time.monotonic", return_value=111.0):
+        cache.get_or_set("key", factory)
+    assert factory.call_count == 2
+
+
+def test_pop_matching_and_maxsize():
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set(("ep1", "blue"), 1)
+    cache.set(("ep2", "blue"), 2)
+    cache.pop_matching(lambda key: key[0] == "ep1")
+    assert cache.get(("ep1", "blue")) is None
+    assert cache.get(("ep2", "blue")) == 2
+
+    cache.set(("ep3", "blue"), 3)
+    cache.set(("ep4", "blue"), 4)
+    assert cache.get(("ep2", "blue")) is None
+    assert cache.get(("ep4", "blue")) == 4
@@ -1,6 +1,8 @@
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 import os
 os.environ.setdefault("AZURE_TENANT_ID", "t")
 os.environ.setdefault("AZURE_CLIENT_ID", "c")
@@ -35,6 +37,27 @@ def override_db():
         db.close()
 
 
+@pytest.fixture
+def session_factory():
+    """Serve ``get_db`` from one in-memory database shared by every session."""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(bind=engine)
+
+    def testing_db():
+        with TestingSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = testing_db
+    yield TestingSessionLocal
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
 def test_create_dataset():
     app.dependency_overrides[get_db] = override_db
     mock_service = MagicMock()
@@ -102,3 +125,257 @@ def test_create_dataset_error():
         resp = client.post("/datasets", files={"file": ("data.csv", f, "text/csv")})
     assert resp.status_code in (500, 403)
     app.dependency_overrides.clear()
+
+
+def test_validate_traffic_allocation():
+    from fastapi import HTTPException
+    from app.routes.deploy import validate_traffic_allocation
+
+    validate_traffic_allocation({"blue": 90, "green": 10})
+    with pytest.raises(HTTPException) as exc:
+        validate_traffic_allocation({"blue": 90})
+    assert exc.value.status_code == 400
+    with pytest.raises(HTTPException) as exc:
+        validate_traffic_allocation({"blue": 150, "green": -50})
+    assert "between 0 and 100" in exc.value.detail
+
+
+def test_batch_rejects_nested_batch():
+    from app.auth import UserInfo, get_current_user
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: UserInfo("u", "ADMIN")
+    for url in ("/batch", "/./batch", "/x/../batch", "/%62atch", "/batch/"):
+        response = client.post(
+            "/batch",
+            json={
+                "requests": [
+                    {"id": "a", "method": "POST", "url": url, "body": {"requests": []}}
+                ]
+            },
+        )
+        assert response.status_code == 400, url
+    app.dependency_overrides.clear()
+
+
+def test_batch_reports_failing_sub_request():
+    from app.auth import UserInfo, get_current_user
+
+    def failing_db():
+        raise RuntimeError("boom")
+
+    app.dependency_overrides[get_db] = failing_db
+    app.dependency_overrides[get_current_user] = lambda: UserInfo("u", "ADMIN")
+    response = client.post(
+        "/batch",
+        json={"requests": [{"id": "a", "method": "GET", "url": "/models"}]},
+    )
+    assert response.status_code == 200
+    assert response.json()["responses"][0]["status"] == 500
+    app.dependency_overrides.clear()
+
+
+def test_delete_run_checks_role_before_database():
+    from app.auth import UserInfo, get_current_user
+
+    mock_db = MagicMock()
+    app.dependency_overrides[get_db] = lambda: mock_db
+    app.dependency_overrides[get_current_user] = lambda: UserInfo("u", "USER")
+    response = client.delete("/runs/00000000-0000-0000-0000-000000000000")
+    assert response.status_code == 403
+    mock_db.execute.assert_not_called()
+    app.dependency_overrides.clear()
+
+
+def test_routes_registered_once():
+    seen = [
+        (route.path, method)
+        for route in app.routes
+        for method in getattr(route, "methods", None) or ["WEBSOCKET"]
+    ]
+    assert len(seen) == len(set(seen))
+
+
+def test_list_users_runs_one_query(session_factory):
+    from sqlalchemy import event
+
+    import app.routes.users as users_route
+    from app.auth import UserInfo, get_current_user
+    from app.db.models import Role as RoleModel
+    from app.db.models import User as UserModel
+
+    with session_factory() as db:
+        db.add(RoleModel(id="22222222-2222-2222-2222-222222222222", name="USER"))
+        for i in range(3):
+            db.add(
+                UserModel(
+                    id=f"0000000{i}-0000-0000-0000-000000000000",
+                    role_id="22222222-2222-2222-2222-222222222222",
+                )
+            )
+        db.commit()
+
+    statements = []
+    event.listen(
+        session_factory.kw["bind"],
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    app.dependency_overrides[get_current_user] = lambda: UserInfo("u", "USER")
+    users_route._users_cache.clear()
+    response = client.get("/users")
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert len(statements) == 1
+    users_route._users_cache.clear()
+
+
+def test_list_users_serves_stale_copy_when_database_is_down(session_factory):
+    from sqlalchemy.exc import OperationalError
+
+    import app.routes.users as users_route
+    from app.auth import UserInfo, get_current_user
+    from app.db.models import Role as RoleModel
+    from app.db.models import User as UserModel
+
+    with session_factory() as db:
+        db.add(RoleModel(id="22222222-2222-2222-2222-222222222222", name="USER"))
+        db.add(
+            UserModel(
+                id="00000000-0000-0000-0000-000000000000",
+                role_id="22222222-2222-2222-2222-222222222222",
+            )
+        )
+        db.commit()
+
+    app.dependency_overrides[get_current_user] = lambda: UserInfo("u", "USER")
+    users_route._users_cache.clear()
+    users_route._users_fallback.clear()
+    fresh = client.get("/users")
+    assert fresh.status_code == 200
+    assert "x-stale" not in fresh.headers
+
+    down_db = MagicMock()
+    down_db.query.side_effect = OperationalError("SELECT", {}, Exception("down"))
+    app.dependency_overrides[get_db] = lambda: down_db
+    users_route._users_cache.clear()
+    stale = client.get("/users")
+    assert stale.status_code == 200
+    assert stale.headers["x-stale"] == "true"
+    assert stale.json() == fresh.json()
+
+    users_route._users_fallback.clear()
+    with pytest.raises(OperationalError):
+        client.get("/users")
+    users_route._users_cache.clear()
+
+
+def test_get_model_revalidates_with_etag(session_factory):
+    import app.routes.models as models_route
+    from app.auth import UserInfo, get_current_user
+    from app.db.models import Model as ModelModel
+
+    with session_factory() as db:
+        db.add(
+            ModelModel(
+                id="33333333-3333-3333-3333-333333333333",
+                user_id="00000000-0000-0000-0000-000000000000",
+                azure_model_name="churn",
+                azure_model_version="2",
+            )
+        )
+        db.commit()
+
+    app.dependency_overrides[get_current_user] = lambda: UserInfo("u", "USER")
+    models_route._model_cache.clear()
+    url = "/models/33333333-3333-3333-3333-333333333333"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    changed = client.get(url, headers={"If-None-Match": '"stale"'})
+    assert changed.status_code == 200
+    assert changed.json() == response.json()
+    models_route._model_cache.clear()
+
+
+def test_download_model_streams_chunks(session_factory):
+    import app.routes.models as models_route
+    from app.auth import UserInfo, get_current_user
+    from app.db.models import Model as ModelModel
+
+    with session_factory() as db:
+        db.add(
+            ModelModel(
+                id="33333333-3333-3333-3333-333333333333",
+                user_id="00000000-0000-0000-0000-000000000000",
+                azure_model_name="churn",
+                azure_model_version="2",
+            )
+        )
+        db.commit()
+
+    mock_service = MagicMock()
+    mock_service.download_model.return_value = iter([b"ab", b"cd"])
+    app.dependency_overrides[get_current_user] = lambda: UserInfo("u", "USER")
+    app.dependency_overrides[models_route.get_service] = lambda: mock_service
+    response = client.get("/models/33333333-3333-3333-3333-333333333333/download")
+    assert response.status_code == 200
+    assert response.content == b"abcd"
+    mock_service.download_model.assert_called_once_with("churn", "2")
+
+
+def test_set_deployment_entry_merges_and_rejects_bad_names(session_factory):
+    from app.db.models import Endpoint as EndpointModel
+    from app.routes.endpoints import _set_deployment_entry
+
+    endpoint_id = "44444444-4444-4444-4444-444444444444"
+    with session_factory() as db:
+        db.add(EndpointModel(id=endpoint_id, name="churn"))
+        db.commit()
+
+        _set_deployment_entry(db, endpoint_id, "blue", {"status": "Creating"})
+        _set_deployment_entry(db, endpoint_id, "green-2", {"status": "Succeeded"})
+        _set_deployment_entry(db, endpoint_id, "blue", {"status": "Succeeded"})
+        db.commit()
+        assert db.get(EndpointModel, endpoint_id).deployments == {
+            "blue": {"status": "Succeeded"},
+            "green-2": {"status": "Succeeded"},
+        }
+
+        for name in ('bl"ue', "a", "2blue", "blue.green"):
+            with pytest.raises(ValueError):
+                _set_deployment_entry(db, endpoint_id, name, {})
+
+
+def test_websockets_reject_missing_token():
+    from starlette.websockets import WebSocketDisconnect
+
+    app.dependency_overrides[get_db] = override_db
+    for url in (
+        "/ws/runs/00000000-0000-0000-0000-000000000000/status",
+        "/ws/endpoints/00000000-0000-0000-0000-000000000000/traffic",
+    ):
+        with pytest.raises(WebSocketDisconnect) as exc:
+            with client.websocket_connect(url) as websocket:
+                websocket.receive_text()
+        assert exc.value.code == 1008
+    app.dependency_overrides.clear()
+
+
+def test_delete_endpoint_checks_role_before_database():
+    from app.auth import UserInfo, get_current_user
+
+    mock_db = MagicMock()
+    app.dependency_overrides[get_db] = lambda: mock_db
+    app.dependency_overrides[get_current_user] = lambda: UserInfo("u", "USER")
+    response = client.delete("/endpoints/00000000-0000-0000-0000-000000000000")
+    assert response.status_code == 403
+    mock_db.get.assert_not_called()
+    app.dependency_overrides.clear()
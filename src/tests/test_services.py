@@ -55,3 +55,37 @@ def test_start_experiment(mock_classification, mock_client, mock_cred):
     )
     run = svc.start_experiment(exp)
     assert run.job_name == "job1"
+
+
+def test_call_with_timeout():
+    import time
+
+    import pytest
+
+    from automlapi.services.azure_client import AzureMLClientError, call_with_timeout
+
+    assert call_with_timeout(1, lambda x, y=0: x + y, 1, y=2) == 3
+    with pytest.raises(AzureMLClientError, match="timed out"):
+        call_with_timeout(0.05, time.sleep, 1)
+
+
+def test_cached_token_credential_reuses_token_until_margin():
+    from unittest.mock import MagicMock
+
+    from azure.core.credentials import AccessToken
+
+    from automlapi.services.azure_client import CachedTokenCredential
+
+    inner = MagicMock()
+    inner.get_token.side_effect = [
+        AccessToken("t1", 1_000 + 600),
+        AccessToken("t2", 1_000 + 3600),
+    ]
+    cred = CachedTokenCredential(inner, refresh_margin=300)
+
+    with patch("automlapi.services.azure_client.time.time", return_value=1_000):
+        assert cred.get_token("scope").token == "t1"
+        assert cred.get_token("scope").token == "t1"
+    with patch("automlapi.services.azure_client.time.time", return_value=1_400):
+        assert cred.get_token("scope").token == "t2"
+    assert inner.get_token.call_count == 2